@@ -0,0 +1,215 @@
+#genre-level mental health aggregates used by Explore and Get Recommendations
+import numpy as np
+import pandas as pd
+
+from cleaning import frequency_matrix, remove_outliers
+from data_loader import FREQUENCY_COLUMNS, FREQUENCY_DTYPE, FREQUENCY_LEVELS, GENRES, MH_COLUMNS, iter_survey
+
+#recoded frequency levels: Never, Rarely, Sometimes, Very frequently
+LEVELS = [1, 2, 3, 4]
+
+CUBE_INDEX = pd.MultiIndex.from_product([GENRES, LEVELS, MH_COLUMNS], names=["genre", "level", "measure"])
+
+
+def frequency_cube(survey):
+    #count, sum, mean, and variance of every MH score for every (genre, frequency level) in one pass
+    #each respondent lands in 16 cells (one per Frequency column) for each of the 4 measures,
+    #so the whole survey is folded into 16 x 4 x 4 cells with a single bincount per statistic
+    freq = frequency_matrix(survey)
+    scores = survey[MH_COLUMNS].to_numpy(dtype="float64")
+    return cube_from_sums(*_cube_sums(freq, scores))
+
+
+def _cube_sums(freq, scores):
+    cell, values = _cube_cells(freq, scores)
+    size = len(CUBE_INDEX)
+    count = np.bincount(cell, minlength=size).astype("float64")
+    total = np.bincount(cell, weights=values, minlength=size)
+    total_sq = np.bincount(cell, weights=values * values, minlength=size)
+    return count, total, total_sq
+
+
+def _cube_cells(freq, scores):
+    #every (respondent, genre, measure) score with the cube cell it belongs to
+    n_genres, n_levels, n_measures = len(GENRES), len(LEVELS), len(MH_COLUMNS)
+
+    #levels that aren't 1-4 (0 = missing) don't land in any cell
+    level_idx = np.searchsorted(LEVELS, freq)
+    valid_level = (level_idx < n_levels) & (np.take(LEVELS, np.minimum(level_idx, n_levels - 1)) == freq)
+
+    #(row, genre, measure) -> flat cell number
+    cell = (np.arange(n_genres)[None, :] * n_levels + level_idx)[:, :, None] * n_measures + np.arange(n_measures)
+    values = np.broadcast_to(scores[:, None, :], cell.shape)
+    keep = valid_level[:, :, None] & ~np.isnan(values)
+    return cell[keep], values[keep]
+
+
+def box_cube(survey, whis=1.5):
+    #quartiles, whisker ends and outliers of every MH score for every (genre, frequency level),
+    #the statistics a box plot draws (as matplotlib/seaborn work them out: linear quartiles,
+    #whiskers at the furthest values within whis * IQR of the box, anything beyond is an outlier)
+    #the scores only take a handful of values, so one bincount gives every cell's histogram over
+    #them, and each statistic is read off the cumulative counts without sorting any rows
+    #(each score is swapped for its position among the distinct scores before it's spread over the cells)
+    matrix = survey[MH_COLUMNS].to_numpy(dtype="float64")
+    scores = np.unique(matrix[~np.isnan(matrix)])
+    positions = np.where(np.isnan(matrix), np.nan, np.searchsorted(scores, matrix))
+    cell, value_idx = _cube_cells(frequency_matrix(survey), positions)
+    value_idx = value_idx.astype(np.int64)
+    n_cells = len(CUBE_INDEX)
+    hist = np.bincount(cell * len(scores) + value_idx, minlength=n_cells * len(scores)).reshape(n_cells, len(scores))
+    count = hist.sum(axis=1)
+    below = hist.cumsum(axis=1)
+    filled = count > 0
+
+    def nth(rank):
+        #each cell's rank-th smallest score (0-based)
+        return scores[np.minimum((below <= rank[:, None]).sum(axis=1), len(scores) - 1)] if len(scores) else rank * np.nan
+
+    def quantile(q):
+        position = q * np.maximum(count - 1, 0)
+        low = np.floor(position)
+        return np.where(filled, nth(low) + (position - low) * (nth(np.ceil(position)) - nth(low)), np.nan)
+
+    q1, med, q3 = quantile(0.25), quantile(0.5), quantile(0.75)
+    reach = whis * (q3 - q1)
+    inside = (scores >= (q1 - reach)[:, None]) & (scores <= (q3 + reach)[:, None]) & (hist > 0)
+    with np.errstate(invalid="ignore"):
+        whislo = np.where(inside, scores, np.inf).min(axis=1, initial=np.inf)
+        whishi = np.where(inside, scores, -np.inf).max(axis=1, initial=-np.inf)
+    #each cell's outliers, smallest first
+    outliers = np.where(inside, 0, hist)
+    fliers = [np.repeat(scores, row) for row in outliers]
+    return pd.DataFrame({
+        "count": count, "q1": q1, "med": med, "q3": q3,
+        "whislo": np.where(filled, whislo, np.nan), "whishi": np.where(filled, whishi, np.nan),
+        "fliers": pd.Series(fliers, dtype=object).to_numpy(),
+    }, index=CUBE_INDEX)
+
+
+def box_stats(cube, genre, measure):
+    #one genre's boxes for one measure, a box per frequency level anyone answered, ready for Axes.bxp
+    cells = cube.xs((genre, measure), level=("genre", "measure"))
+    return [{"label": FREQUENCY_LEVELS[level - 1], "med": row.med, "q1": row.q1, "q3": row.q3,
+             "whislo": row.whislo, "whishi": row.whishi, "fliers": row.fliers}
+            for level, row in cells[cells["count"] > 0].iterrows()]
+
+
+def stream_frequency_cube(path, chunk_size=100_000):
+    #the same cube as frequency_cube(encode_survey(remove_outliers(fill_bpm(survey)))), read from the
+    #CSV a chunk at a time, so memory depends on chunk_size instead of the size of the file
+    #(BPM imputation doesn't touch any column the cube uses, so it's skipped)
+    store = AggregateStore()
+    for chunk in iter_survey(path, ["Age", "Hours per day"] + FREQUENCY_COLUMNS + MH_COLUMNS, chunk_size):
+        store.append(chunk)
+    return store.cube()
+
+
+def cube_from_sums(count, total, total_sq):
+    #derive the mean and (sample) variance from running sums, so cubes built from
+    #chunks or batches can be added together before this step
+    count = np.asarray(count, dtype="float64")
+    total = np.asarray(total, dtype="float64")
+    total_sq = np.asarray(total_sq, dtype="float64")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(count > 0, total / count, np.nan)
+        var = np.where(count > 1, (total_sq - total * total / np.maximum(count, 1)) / (count - 1), np.nan)
+    return pd.DataFrame({"count": count, "sum": total, "sumsq": total_sq, "mean": mean, "var": np.maximum(var, 0)},
+                        index=CUBE_INDEX)
+
+
+def cube_slice(cube, stat="mean", level=4):
+    #a genre x measure table of one statistic at one frequency level
+    table = cube.xs(level, level="level")[stat].unstack("measure")
+    return table.reindex(index=GENRES, columns=MH_COLUMNS).rename_axis(index=None, columns=None)
+
+
+def genre_averages(cube, level=4):
+    #average MH scores of everyone who listens to each genre at the given frequency
+    #(4 = Very frequently, the only level the recommendations use)
+    return cube_slice(cube, "mean", level)
+
+
+def add_effect(mh_by_genre, threshold=5):
+    #1 if the genre's average depression score is at/above the threshold, else 0
+    mh_by_genre = mh_by_genre.copy()
+    mh_by_genre["Effect"] = np.where(mh_by_genre["Depression"] >= threshold, 1, 0)
+    return mh_by_genre
+
+
+def effect_table(mh_by_genre):
+    #this dataframe will be used to connect this analysis with the second dataset
+    return add_effect(mh_by_genre).reset_index(names="Genre")
+
+
+def _survey_types(batch):
+    #rows that didn't come through the loader (plain read_csv, form answers) have the Frequency
+    #answers as strings and the numbers possibly as strings too: give them the loader's types
+    #(Frequency columns that are already categoricals or recoded levels are left as they are)
+    text = {column: FREQUENCY_DTYPE for column in FREQUENCY_COLUMNS
+            if column in batch and not isinstance(batch[column].dtype, pd.CategoricalDtype)
+            and not pd.api.types.is_numeric_dtype(batch[column])}
+    numbers = {column: "float64" for column in ["Age", "Hours per day"] + MH_COLUMNS if column in batch}
+    return batch.astype({**text, **numbers})
+
+
+class AggregateStore:
+    #running counts and sums per (genre, frequency level, measure) that new survey responses
+    #are folded into as they arrive: an append costs O(batch), never a pass over the whole survey,
+    #and the Effect flags are only re-derived for genres whose average crossed the threshold
+
+    def __init__(self, threshold=5, level=4):
+        self.threshold = threshold
+        self.level = level
+        self.count = np.zeros(len(CUBE_INDEX))
+        self.total = np.zeros(len(CUBE_INDEX))
+        self.total_sq = np.zeros(len(CUBE_INDEX))
+        #responses kept after the outlier filters, and the newest Timestamp seen so far
+        self.rows = 0
+        self.latest = None
+        #cube positions of the genre x measure cells at `level`
+        self._cells = CUBE_INDEX.get_locs([slice(None), level, slice(None)])
+        self.effects = {genre: 0 for genre in GENRES}
+
+    def append(self, batch):
+        #fold in a batch of raw survey rows; returns the genres whose Effect flipped
+        batch = remove_outliers(_survey_types(batch))
+        count, total, total_sq = _cube_sums(frequency_matrix(batch), batch[MH_COLUMNS].to_numpy(dtype="float64"))
+        self.count += count
+        self.total += total
+        self.total_sq += total_sq
+        self.rows += len(batch)
+        if "Timestamp" in batch and len(batch):
+            latest = pd.to_datetime(batch["Timestamp"], format="%m/%d/%Y %H:%M:%S").max()
+            self.latest = latest if self.latest is None else max(self.latest, latest)
+        return self._update_effects()
+
+    def _update_effects(self):
+        #only the genres' averages at `level` are worked out (16 cells), and only the
+        #genres that crossed the threshold get a new flag
+        depression = self._means().loc[:, "Depression"]
+        changed = []
+        for genre, value in depression.items():
+            effect = 1 if value >= self.threshold else 0
+            if self.effects[genre] != effect:
+                self.effects[genre] = effect
+                changed.append(genre)
+        return changed
+
+    def _means(self):
+        cells = self._cells
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(self.count[cells] > 0, self.total[cells] / self.count[cells], np.nan)
+        return pd.DataFrame(means.reshape(len(GENRES), len(MH_COLUMNS)), index=GENRES, columns=MH_COLUMNS)
+
+    def cube(self):
+        return cube_from_sums(self.count, self.total, self.total_sq)
+
+    def mh_by_genre(self):
+        return self._means()
+
+    def effect_table(self):
+        #the same table as effect_table(genre_averages(cube)), from the flags kept up to date by append
+        effect_df = self._means()
+        effect_df["Effect"] = np.array([self.effects[genre] for genre in effect_df.index])
+        return effect_df.reset_index(names="Genre")
@@ -0,0 +1,327 @@
+#benchmarks for every section of the app and every pipeline stage, at scaled data sizes
+#the scaled datasets repeat the rows of mxmh_survey_results.csv and songs_normalize.csv
+#1x, 10x, 100x and 1000x, and every measurement (wall time and peak memory) is appended
+#to a JSON lines history tagged with the commit, so runs can be compared across commits
+#
+#   python benchmarks.py                          every stage and section at every scale
+#   python benchmarks.py --scales 1 10 --only stages
+#   python benchmarks.py --scales 1 --only imports  per-section import cost in fresh processes
+#   python benchmarks.py --synthetic              generated rows instead of repeated ones
+#   python benchmarks.py --compare                latest commit vs the one before it
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+import figures
+import pipeline
+import sections
+import synthetic
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(REPO_DIR, "real_prac_1.py")
+BENCHMARK_DIR = os.path.join(REPO_DIR, ".benchmarks")
+HISTORY_PATH = os.path.join(BENCHMARK_DIR, "history.jsonl")
+
+SCALES = [1, 10, 100, 1000]
+SECTIONS = list(sections.SECTIONS)
+
+
+def scaled_data(scale, root=BENCHMARK_DIR, generated=False):
+    #a directory holding both CSVs with every data row repeated `scale` times
+    #(or, with generated=True, `scale` times as many synthetic rows from synthetic.py)
+    #written once per scale and reused by later runs
+    directory = os.path.join(root, "data", f"{'synthetic' if generated else 'x'}{scale}")
+    for source in (data_loader.SURVEY_PATH, data_loader.SONGS_PATH):
+        target = os.path.join(directory, os.path.basename(source))
+        if os.path.exists(target):
+            continue
+        os.makedirs(directory, exist_ok=True)
+        if generated:
+            write = synthetic.write_survey if source == data_loader.SURVEY_PATH else synthetic.write_songs
+            with open(os.path.join(REPO_DIR, source), "rb") as f:
+                rows = sum(1 for _ in f) - 1
+            tmp_path = f"{target}.{os.getpid()}.tmp"
+            write(tmp_path, rows * scale)
+            os.replace(tmp_path, target)
+            continue
+        with open(os.path.join(REPO_DIR, source), "rb") as f:
+            header = f.readline()
+            body = f.read()
+        if not body.endswith(b"\n"):
+            body += b"\n"
+        tmp_path = f"{target}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            for _ in range(scale):
+                f.write(body)
+        os.replace(tmp_path, target)
+    return directory
+
+
+def measure(func, repeat=3):
+    #best wall time over `repeat` runs, then one more run under tracemalloc for the peak
+    #(tracemalloc slows allocation-heavy code down, so it's kept out of the timed runs)
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(times), peak
+
+
+def stage_benchmarks(directory, repeat=3):
+    #every pipeline stage on its own, fed the already computed outputs of its parents
+    survey_path = os.path.join(directory, os.path.basename(data_loader.SURVEY_PATH))
+    songs_path = os.path.join(directory, os.path.basename(data_loader.SONGS_PATH))
+    cleaning_pipeline = pipeline.CleaningPipeline(survey_path, songs_path)
+
+    def load(root):
+        path, loader = cleaning_pipeline.roots[root]
+        def run():
+            data_loader.clear_cache()
+            loader(path, copy=False)
+        return run
+
+    def stage(name):
+        _, func = cleaning_pipeline.stages[name]
+        inputs = [cleaning_pipeline.get(parent, copy=False) for parent in cleaning_pipeline.parents(name)]
+        #stages shouldn't edit their inputs, but a copy per run keeps a bad one from skewing the next
+        return lambda: func(*[i.copy() if isinstance(i, (pd.DataFrame, pd.Series)) else i for i in inputs])
+
+    for name in cleaning_pipeline.stage_names():
+        run = load(name) if name in cleaning_pipeline.roots else stage(name)
+        yield name, measure(run, repeat)
+    data_loader.clear_cache()
+
+
+def section_benchmarks(directory, repeat=1, timeout=3600):
+    #every section of the app end to end through Streamlit's script runner, run against the
+    #scaled CSVs: "cold" starts from empty caches and no snapshots, "warm" is the rerun after it
+    from streamlit.testing.v1 import AppTest
+
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        for section in SECTIONS:
+            for warm in (False, True):
+                elapsed, renders = [], []
+
+                def run():
+                    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+                    if not warm:
+                        reset_caches()
+                    at.run()
+                    at.selectbox[0].select(section).run()
+                    if warm:
+                        #everything the section needs is cached now, time only the rerun
+                        start = time.perf_counter()
+                        at.run()
+                        elapsed.append(time.perf_counter() - start)
+                    run.errors = [str(e.value) for e in at.exception]
+                    #the section's own render time, without the script runner around it
+                    renders.append(sections.timings[section][-1])
+
+                name = f"{section} ({'warm' if warm else 'cold'})"
+                try:
+                    wall, peak = measure(run, repeat)
+                    #the last run was the tracemalloc one, which is slower
+                    if warm:
+                        wall = min(elapsed[:-1])
+                    yield name, (wall, peak), run.errors, {"render_s": min(renders[:-1])}
+                except Exception as e:  #a timeout or a crash in one section shouldn't stop the rest
+                    yield name, (None, None), [repr(e)], {}
+    finally:
+        reset_caches()
+        os.chdir(cwd)
+
+
+#runs one section in a fresh interpreter and prints what it took as JSON
+_IMPORT_PROBE = """
+import json, sys, time
+sys.path.insert(0, {repo!r})
+from streamlit.testing.v1 import AppTest
+import lazy
+
+at = AppTest.from_file({app!r}, default_timeout={timeout!r})
+modules = len(sys.modules)
+start = time.perf_counter()
+at.run()
+if {section!r} != at.selectbox[0].value:
+    lazy.import_times.clear()
+    modules = len(sys.modules)
+    start = time.perf_counter()
+    at.selectbox[0].select({section!r}).run()
+print(json.dumps({{"wall_s": time.perf_counter() - start, "imports": lazy.import_times,
+                  "new_modules": len(sys.modules) - modules, "errors": [str(e.value) for e in at.exception]}}))
+"""
+
+
+def import_benchmarks(directory, timeout=3600):
+    #what each section costs in a brand new process, and which deferred imports it paid for
+    #(the first page is always Data Overview, so other sections are measured from the switch to them)
+    for section in SECTIONS:
+        code = _IMPORT_PROBE.format(repo=REPO_DIR, app=APP_PATH, timeout=timeout, section=section)
+        try:
+            result = subprocess.run([sys.executable, "-c", code], cwd=directory, capture_output=True,
+                                    text=True, timeout=timeout, check=True)
+            report = json.loads(result.stdout.strip().splitlines()[-1])
+        except (OSError, subprocess.SubprocessError, ValueError, IndexError) as e:
+            yield section, (None, None), [repr(e)], {}
+            continue
+        extra = {"imports": report["imports"], "new_modules": report["new_modules"]}
+        yield section, (report["wall_s"], None), report["errors"], extra
+
+
+def reset_caches():
+    #drop every in-process cache and the on-disk snapshots of the current directory
+    data_loader.clear_cache()
+    figures.cache.clear()
+    pipeline._default = None
+    shutil.rmtree(os.path.join(os.getcwd(), ".snapshots"), ignore_errors=True)
+
+
+def git_commit():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_DIR, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip() != ""
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, dirty
+
+
+def resolve_commit(ref):
+    #a branch, tag or short hash -> the full commit hash the history is keyed on
+    try:
+        return subprocess.run(["git", "rev-parse", "--verify", f"{ref}^{{commit}}"], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ref
+
+
+def row_counts(directory):
+    counts = []
+    for source in (data_loader.SURVEY_PATH, data_loader.SONGS_PATH):
+        with open(os.path.join(directory, os.path.basename(source)), "rb") as f:
+            counts.append(sum(1 for _ in f) - 1)
+    return counts
+
+
+def run(scales=SCALES, only=None, repeat=3, section_repeat=1, timeout=3600, history=HISTORY_PATH, generated=False):
+    commit, dirty = git_commit()
+    environment = {
+        "commit": commit,
+        "dirty": dirty,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(history)), exist_ok=True)
+
+    for scale in scales:
+        directory = scaled_data(scale, generated=generated)
+        survey_rows, songs_rows = row_counts(directory)
+        suites = []
+        if only in (None, "stages"):
+            suites.append(("stage", ((name, result, [], {}) for name, result in stage_benchmarks(directory, repeat))))
+        if only in (None, "sections"):
+            suites.append(("section", section_benchmarks(directory, section_repeat, timeout)))
+        if only in (None, "imports"):
+            suites.append(("import", import_benchmarks(directory, timeout)))
+
+        for kind, results in suites:
+            for name, (wall, peak), errors, extra in results:
+                record = {**environment, "kind": kind, "name": name, "scale": scale, "synthetic": generated,
+                          "survey_rows": survey_rows, "songs_rows": songs_rows,
+                          "wall_s": wall, "peak_bytes": peak, "errors": errors, **extra}
+                with open(history, "a") as f:
+                    f.write(json.dumps(record) + "\n")
+                print(format_record(record), flush=True)
+
+
+def format_record(record):
+    wall = "failed" if record["wall_s"] is None else f"{record['wall_s'] * 1000:10.1f} ms"
+    peak = "" if record["peak_bytes"] is None else f"{record['peak_bytes'] / 2**20:9.1f} MiB"
+    line = f"{record['scale']:>5}x  {record['kind']:<8} {record['name']:<36} {wall:>13} {peak:>13}"
+    if record.get("imports"):
+        line += "  imported " + ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in record["imports"].items())
+    if record["errors"]:
+        line += f"  ({len(record['errors'])} errors: {record['errors'][0][:80]})"
+    return line
+
+
+def load_history(history=HISTORY_PATH):
+    with open(history) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare(history=HISTORY_PATH, base=None, head=None):
+    #each measurement of `head` against the same measurement at `base`
+    #(default: the two most recent commits in the history)
+    records = load_history(history)
+    commits = list(dict.fromkeys(record["commit"] for record in reversed(records)))
+    if head is None or base is None:
+        if len(commits) < 2:
+            print("Need results from two commits to compare.")
+            return
+        head, base = head or commits[0], base or commits[1]
+    base, head = resolve_commit(base), resolve_commit(head)
+
+    #the latest result for every (commit, kind, name, scale, synthetic data or not)
+    latest = {}
+    for record in records:
+        key = (record["commit"], record["kind"], record["name"], record["scale"], record.get("synthetic", False))
+        latest[key] = record
+
+    print(f"{base[:10]} -> {head[:10]}")
+    for (commit, kind, name, scale, generated), new in latest.items():
+        old = latest.get((base, kind, name, scale, generated))
+        if commit != head or old is None or not old["wall_s"] or new["wall_s"] is None:
+            continue
+        print(f"{scale:>5}{'s' if generated else 'x'}  {kind:<8} {name:<36} {old['wall_s'] * 1000:10.1f} ms -> "
+              f"{new['wall_s'] * 1000:10.1f} ms  ({new['wall_s'] / old['wall_s']:.2f}x time, "
+              f"{(new['peak_bytes'] or 0) / max(old['peak_bytes'] or 1, 1):.2f}x memory)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the app's sections and pipeline stages.")
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES)
+    parser.add_argument("--only", choices=["stages", "sections", "imports"])
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage (the best one is kept)")
+    parser.add_argument("--section-repeat", type=int, default=1, help="timed runs per section")
+    parser.add_argument("--timeout", type=float, default=3600, help="seconds a section may take")
+    parser.add_argument("--synthetic", action="store_true",
+                        help="scale up with generated rows (synthetic.py) instead of repeating the real ones")
+    parser.add_argument("--history", default=HISTORY_PATH)
+    parser.add_argument("--compare", nargs="*", metavar="COMMIT",
+                        help="compare two commits in the history instead of running (default: the last two)")
+    args = parser.parse_args()
+
+    if args.compare is not None:
+        compare(args.history, *(args.compare[:2] + [None, None])[:2])
+        sys.exit(0)
+    run(args.scales, args.only, args.repeat, args.section_repeat, args.timeout, args.history, args.synthetic)
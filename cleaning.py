@@ -0,0 +1,195 @@
+#cleaning steps shared by every section of the app
+import numpy as np
+import pandas as pd
+
+from data_loader import FREQUENCY_COLUMNS, GENRES, NOMINAL_COLUMNS, YES_NO_COLUMNS
+
+#songs genre spellings -> the survey's genre names
+#keys are stripped and case folded, so " pop", "pop" and "Pop" all hit the same entry
+GENRE_ALIASES = {
+    "pop": "Pop",
+    "rock": "Rock",
+    "country": "Country",
+    "metal": "Metal",
+    "hip hop": "Hip hop",
+    "r&b": "R&B",
+    "dance/electronic": "EDM",
+    "folk/acoustic": "Folk",
+    "latin": "Latin",
+    "jazz": "Jazz",
+    "classical": "Classical" }
+
+
+def fill_bpm(survey):
+    return impute_bpm(survey)[0]
+
+
+def impute_bpm(survey, medians=None, group="Fav genre", column="BPM"):
+    #fill missing BPM vals with the median BPM of the row's favorite genre
+    #the medians are worked out in one grouped pass, and only the missing cells are touched
+    #pass medians back in to reuse a fill table from an earlier run, or from
+    #sketches.bpm_sketch(...).median() when the survey is too big to load at once
+    if medians is None:
+        medians = survey.groupby(group, sort=True, observed=True)[column].median()
+
+    missing = survey[column].isna()
+    survey = survey.copy()
+    if missing.any():
+        survey.loc[missing, column] = survey.loc[missing, group].map(medians).astype("float64")
+
+    return survey, medians
+
+
+def remove_outliers(survey):
+    #I don't trust the participants who say they listen to music 24hrs/day
+    #I will say the max they could realistically listen to is 16 hrs
+    survey = survey[(survey["Hours per day"] < 16)]
+    #take away age outliers (3 SDs from the 75% percentile)
+    survey = survey[(survey["Age"] > 18) & (survey["Age"] < 64)]
+    return survey.copy()
+
+
+def frequency_matrix(survey):
+    #the 16 Frequency columns as one contiguous rows x 16 uint8 block, for the aggregates' bincounts
+    #Never/Rarely/Sometimes/Very frequently -> 1/2/3/4, and 0 for a missing answer
+    #0 is not a level: anything reading the block has to skip it (encode_survey masks it back out)
+    #(filled a column at a time, without an intermediate copy of the 16 columns)
+    matrix = np.empty((len(survey), len(FREQUENCY_COLUMNS)), dtype=np.uint8)
+    for i, column in enumerate(FREQUENCY_COLUMNS):
+        column = survey[column]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            #the loader reads these as ordered categoricals, so the codes already are the levels
+            matrix[:, i] = column.cat.codes.to_numpy() + 1
+        else:
+            #encode_survey's nullable UInt8 levels, or plain numbers
+            matrix[:, i] = column.to_numpy(dtype=np.uint8, na_value=0)
+    return matrix
+
+
+def encode_survey(survey):
+    #recode everything the analysis needs in one step:
+    #Frequency columns -> nullable UInt8 levels 1-4 so we can run correlations,
+    #Yes/No answers -> booleans (missing stays missing in both), other text answers -> categoricals
+    order = list(survey.columns)
+    matrix = frequency_matrix(survey)
+    survey = survey.drop(columns=FREQUENCY_COLUMNS)
+
+    for column in YES_NO_COLUMNS:
+        survey[column] = survey[column].astype("object").map({"Yes": True, "No": False}).astype("boolean")
+    for column in NOMINAL_COLUMNS:
+        survey[column] = survey[column].astype("category").cat.remove_unused_categories()
+
+    frequencies = pd.DataFrame({
+        column: pd.arrays.IntegerArray(matrix[:, i], mask=matrix[:, i] == 0)
+        for i, column in enumerate(FREQUENCY_COLUMNS)}, index=survey.index)
+    return pd.concat([survey, frequencies], axis=1)[order]
+
+
+def downsample_genres(survey, genres=("Rock", "Metal", "Pop"), cap="median", seed=42, column="Fav genre"):
+    #reduce the outlier genres to the median count of Fav genre (or any other cap)
+    #genres=None caps every genre. Which rows stay is decided by a seeded hash of each row's
+    #contents, so the same data always gives the same result (and can be cached), in one grouped pass
+    counts = survey[column].value_counts()
+    if cap == "median":
+        cap = int(counts[counts > 0].median())
+
+    key = pd.util.hash_pandas_object(survey, index=False, hash_key=f"{seed:016d}"[-16:])
+    rank = key.groupby(survey[column], observed=True).rank(method="first")
+    keep = rank <= cap
+    if genres is not None:
+        keep |= ~survey[column].isin(genres)
+    return survey[keep.to_numpy()]
+
+
+def balanced_indices(targets, random_state=42):
+    #row numbers of a class-balanced undersample: every class is cut down to the size of the
+    #smallest one (which is kept whole), drawing rows the same way imblearn's RandomUnderSampler does
+    #targets is one class label per row, or a rows x targets array to balance every
+    #combination of the targets jointly (e.g. Anxiety and Depression categories together)
+    targets = np.asarray(targets)
+    if targets.ndim == 2:
+        _, targets = np.unique(targets, axis=0, return_inverse=True)
+        targets = targets.ravel()
+    classes, first_seen, counts = np.unique(targets, return_index=True, return_counts=True)
+    #ties for the smallest class go to whichever class shows up first
+    minority = classes[np.lexsort((first_seen, counts))[0]]
+    n_samples = counts.min()
+
+    random_state = np.random.RandomState(random_state)
+    indices = []
+    for target_class, count in zip(classes, counts):
+        rows = np.flatnonzero(targets == target_class)
+        if target_class != minority:
+            rows = rows[random_state.choice(range(count), size=n_samples, replace=False)]
+        indices.append(rows)
+    return np.concatenate(indices)
+
+
+def binary_categories(frame, columns, threshold=5):
+    #1 where a score is at/above the threshold, else 0, as a rows x columns int8 array
+    return (frame[list(columns)].to_numpy(dtype="float64") >= threshold).astype(np.int8)
+
+
+def undersample(frame, column, threshold=5, random_state=42):
+    #balance a score (or several scores jointly) by undersampling two classes per score:
+    #below the threshold and at/above it
+    #only the 0/1 target arrays are resampled, the frame itself is copied once by the take,
+    #which keeps the original continuous scores
+    columns = [column] if isinstance(column, str) else list(column)
+    indices = balanced_indices(binary_categories(frame, columns, threshold), random_state)
+    return frame.take(indices).reset_index(drop=True)
+
+
+def balance_anxiety(survey):
+    return undersample(survey, "Anxiety")
+
+
+def balance_depression(survey):
+    return undersample(survey, "Depression")
+
+
+def balance_valence(songs):
+    #valence is 0 to 1, so the two classes split at 0.5
+    return add_valence_category(undersample(songs, "valence", threshold=0.5))
+
+
+def remove_explicit(songs):
+    #filter out all explicit songs so the app is appropriate for all users
+    return songs[songs["explicit"] == False].copy()
+
+
+def explode_genres(songs):
+    #some songs are categorized as multiple genres, so list each song once per genre
+    #a pop-rock song should be recommended for pop and rock recommendations
+    songs = songs.copy()
+    songs["genre"] = songs["genre"].str.split(",")
+    return songs.explode("genre").reset_index(drop=True)
+
+
+def normalize_genres(songs_expanded):
+    #make sure genres are consistent and match the names in the first dataset
+    #the column only has a few dozen distinct spellings, so factorize it once and
+    #clean up the distinct values instead of running a replace over every row per alias
+    codes, spellings = pd.factorize(songs_expanded["genre"])
+    cleaned = [spelling.strip() for spelling in spellings]
+    canonical = [GENRE_ALIASES.get(spelling.casefold(), spelling) for spelling in cleaned]
+
+    categories = pd.unique(pd.Series(canonical, dtype="object"))
+    lookup = np.append(pd.Index(categories).get_indexer(canonical), -1)
+
+    songs_expanded = songs_expanded.copy()
+    songs_expanded["genre"] = pd.Categorical.from_codes(lookup[codes], categories=categories)
+    return songs_expanded
+
+
+def unmapped_genres(songs_expanded):
+    #how many song rows have a genre that isn't one of the survey's 16 genres
+    genres = songs_expanded["genre"]
+    unmapped = genres[~genres.isin(GENRES)]
+    return unmapped.value_counts(dropna=False).loc[lambda counts: counts > 0]
+
+
+def add_valence_category(songs):
+    songs = songs.copy()
+    songs["valence_category"] = np.where(songs["valence"] >= 0.5, 1, 0)
+    return songs
@@ -0,0 +1 @@
+#lets plain `pytest` import the app's modules from the repo root, the way streamlit runs them
@@ -0,0 +1,185 @@
+#Pearson, Spearman and Kendall correlations between the survey's numeric columns
+#everything is kept as running sums that new rows are folded into, so appending a batch costs
+#O(batch) and the matrices are re-derived from the sums without another pass over the survey:
+#   - Pearson from pairwise co-moments (counts, sums, sums of squares and products)
+#   - Spearman and Kendall from a contingency table per column pair (how many rows have each
+#     pair of values); every answer here takes a small set of values, so the tables stay small,
+#     and ranks, ties and concordant pairs can all be read off a table's cumulative sums
+#pairs are pairwise-complete, like DataFrame.corr(): each one uses every row that has both values
+#(a missing Frequency answer is left out of its pairs, whether it comes in as NaN/<NA> or as the
+#0 that cleaning.frequency_matrix uses for it)
+import numpy as np
+import pandas as pd
+
+from data_loader import FREQUENCY_COLUMNS, MH_COLUMNS
+
+#every frequency column, listening and demographic columns, and the mental health scores
+COLUMNS = FREQUENCY_COLUMNS + ["Hours per day", "Age", "BPM"] + MH_COLUMNS
+
+METHODS = ("pearson", "spearman", "kendall")
+
+
+def _midranks(counts):
+    #average rank of each value, given how many rows have each value (in sorted order)
+    return np.cumsum(counts) - (counts - 1) / 2
+
+
+def _weighted_pearson(table, row_values, col_values):
+    n = table.sum()
+    rows, cols = table.sum(axis=1), table.sum(axis=0)
+    row_dev = row_values - rows @ row_values / n
+    col_dev = col_values - cols @ col_values / n
+    denominator = np.sqrt((rows @ row_dev ** 2) * (cols @ col_dev ** 2))
+    return row_dev @ table @ col_dev / denominator if denominator > 0 else np.nan
+
+
+def spearman_from_table(table):
+    #Pearson between the (average-tie) ranks of the two columns
+    return _weighted_pearson(table, _midranks(table.sum(axis=1)), _midranks(table.sum(axis=0)))
+
+
+def kendall_from_table(table):
+    #tau-b, as scipy.stats.kendalltau: every cell is paired with the cells strictly above-right
+    #of it (concordant) and strictly above-left (discordant), using 2-d cumulative sums
+    n = table.sum()
+    above_right = np.zeros_like(table)
+    above_right[:-1, :-1] = table[::-1, ::-1].cumsum(axis=0).cumsum(axis=1)[::-1, ::-1][1:, 1:]
+    above_left = np.zeros_like(table)
+    above_left[:-1, 1:] = table[::-1, :].cumsum(axis=0).cumsum(axis=1)[::-1, :][1:, :-1]
+    concordant = (table * above_right).sum()
+    discordant = (table * above_left).sum()
+    pairs = n * (n - 1) / 2
+    rows, cols = table.sum(axis=1), table.sum(axis=0)
+    denominator = np.sqrt((pairs - (rows * (rows - 1) / 2).sum()) * (pairs - (cols * (cols - 1) / 2).sum()))
+    return (concordant - discordant) / denominator if denominator > 0 else np.nan
+
+
+class CorrelationStore:
+
+    def __init__(self, columns=COLUMNS):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.rows = 0
+        #co-moments over the rows where both columns of a pair are present, taken around a fixed
+        #shift per column (the first batch's means) so the sums don't lose precision as they grow
+        self.shift = None
+        self.count = np.zeros((k, k))
+        self.total = np.zeros((k, k))
+        self.total_sq = np.zeros((k, k))
+        self.total_product = np.zeros((k, k))
+        #sorted distinct values of each column, and (i, j) -> contingency table over them
+        self.levels = [np.array([]) for _ in range(k)]
+        self.tables = {}
+        #method -> full matrix, until the next append
+        self._matrices = {}
+
+    def append(self, batch):
+        values = batch[self.columns].to_numpy(dtype="float64", na_value=np.nan, copy=True)
+        #0 is not a Frequency level (Never is 1), it stands for a missing answer
+        frequency = [i for i, column in enumerate(self.columns) if column in FREQUENCY_COLUMNS]
+        values[:, frequency] = np.where(values[:, frequency] == 0, np.nan, values[:, frequency])
+        present = ~np.isnan(values)
+        if self.shift is None:
+            self.shift = np.where(present, values, 0).sum(axis=0) / np.maximum(present.sum(axis=0), 1)
+        centered = np.where(present, values - self.shift, 0)
+        mask = present.astype("float64")
+        #[i, j] sums column i over the rows where column j is present too
+        self.count += mask.T @ mask
+        self.total += centered.T @ mask
+        self.total_sq += (centered ** 2).T @ mask
+        self.total_product += centered.T @ centered
+        self._add_tables(values, present)
+        self.rows += len(batch)
+        self._matrices.clear()
+        return self
+
+    def _add_tables(self, values, present):
+        codes = []
+        for i, column in enumerate(values.T):
+            new = np.unique(column[present[:, i]])
+            levels = np.union1d(self.levels[i], new)
+            if len(levels) != len(self.levels[i]):
+                self._grow(i, levels)
+            codes.append(np.searchsorted(levels, np.where(present[:, i], column, levels[0] if len(levels) else 0)))
+        k = len(self.columns)
+        complete_columns = present.all(axis=0)
+        for i in range(k):
+            for j in range(i + 1, k):
+                a, b = len(self.levels[i]), len(self.levels[j])
+                if complete_columns[i] and complete_columns[j]:
+                    pair_codes = codes[i] * b + codes[j]
+                else:
+                    both = present[:, i] & present[:, j]
+                    pair_codes = codes[i][both] * b + codes[j][both]
+                counts = np.bincount(pair_codes, minlength=a * b).reshape(a, b)
+                table = self.tables.get((i, j))
+                self.tables[(i, j)] = counts if table is None else table + counts
+
+    def _grow(self, i, levels):
+        #new values turned up in column i: re-lay its tables out over the wider set of levels
+        positions = np.searchsorted(levels, self.levels[i])
+        for (first, second), table in self.tables.items():
+            if first == i:
+                grown = np.zeros((len(levels), table.shape[1]), dtype=table.dtype)
+                grown[positions] = table
+                self.tables[(first, second)] = grown
+            elif second == i:
+                grown = np.zeros((table.shape[0], len(levels)), dtype=table.dtype)
+                grown[:, positions] = table
+                self.tables[(first, second)] = grown
+        self.levels[i] = levels
+
+    def _pearson(self):
+        n = self.count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            covariance = n * self.total_product - self.total * self.total.T
+            #[i, j] is column i's variance over the rows it shares with column j
+            variance = n * self.total_sq - self.total ** 2
+            matrix = covariance / np.sqrt(variance * variance.T)
+        matrix[(n < 2) | ~np.isfinite(matrix)] = np.nan
+        return np.clip(matrix, -1, 1)
+
+    def _from_tables(self, method):
+        measure = spearman_from_table if method == "spearman" else kendall_from_table
+        k = len(self.columns)
+        matrix = np.full((k, k), np.nan)
+        for (i, j), table in self.tables.items():
+            if table.sum() >= 2:
+                matrix[i, j] = matrix[j, i] = measure(table)
+        return matrix
+
+    def matrix(self, method="pearson", columns=None):
+        if method not in METHODS:
+            raise ValueError(f"Unknown correlation method: {method} (expected one of {', '.join(METHODS)})")
+        if method not in self._matrices:
+            matrix = self._pearson() if method == "pearson" else self._from_tables(method)
+            #a column with any spread correlates perfectly with itself
+            diagonal = np.diag(self.count) >= 2
+            spread = np.array([len(levels) > 1 for levels in self.levels])
+            np.fill_diagonal(matrix, np.where(diagonal & spread, 1.0, np.nan))
+            self._matrices[method] = pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+        result = self._matrices[method]
+        return result if columns is None else result.loc[columns, columns]
+
+    def counts(self, columns=None):
+        #rows behind each pair's correlation
+        counts = pd.DataFrame(self.count, index=self.columns, columns=self.columns)
+        return counts if columns is None else counts.loc[columns, columns]
+
+    def significant(self, method="pearson", columns=None, z=1.96):
+        #pairs whose correlation is unlikely to be zero (two-sided, 5% by default), by the
+        #large-sample normal approximation: r*sqrt((n-2)/(1-r^2)) for pearson/spearman,
+        #tau / sqrt(2(2n+5) / 9n(n-1)) for kendall
+        r = self.matrix(method, columns).to_numpy()
+        n = self.counts(columns).to_numpy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if method == "kendall":
+                critical = z * np.sqrt(2 * (2 * n + 5) / (9 * n * (n - 1)))
+            else:
+                critical = z / np.sqrt(n - 2 + z ** 2)
+            return np.nan_to_num(np.abs(r) > critical)
+
+
+def correlations(survey, columns=COLUMNS):
+    #a store over whichever of the columns the survey has
+    return CorrelationStore([column for column in columns if column in survey]).append(survey)
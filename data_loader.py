@@ -0,0 +1,140 @@
+import hashlib
+import os
+import threading
+
+import pandas as pd
+
+#the two datasets the app is built on
+SURVEY_PATH = "mxmh_survey_results.csv"
+SONGS_PATH = "songs_normalize.csv"
+
+FREQUENCY_COLUMNS = ["Frequency [Classical]", "Frequency [Country]", "Frequency [EDM]", "Frequency [Folk]",
+    "Frequency [Gospel]", "Frequency [Hip hop]", "Frequency [Jazz]", "Frequency [K pop]", "Frequency [Latin]",
+    "Frequency [Lofi]", "Frequency [Metal]", "Frequency [Pop]", "Frequency [R&B]", "Frequency [Rap]",
+    "Frequency [Rock]", "Frequency [Video game music]"]
+
+#the survey's 16 genre names, as they appear inside the Frequency [...] column names
+GENRES = [column[len("Frequency ["):-1] for column in FREQUENCY_COLUMNS]
+
+MH_COLUMNS = ["Anxiety", "Depression", "Insomnia", "OCD"]
+
+#answers to the Frequency [...] questions, in order
+FREQUENCY_LEVELS = ["Never", "Rarely", "Sometimes", "Very frequently"]
+FREQUENCY_DTYPE = pd.CategoricalDtype(FREQUENCY_LEVELS, ordered=True)
+
+YES_NO_COLUMNS = ["While working", "Instrumentalist", "Composer", "Exploratory", "Foreign languages"]
+NOMINAL_COLUMNS = ["Primary streaming service", "Fav genre", "Music effects", "Permissions"]
+
+#explicit dtypes so pandas doesn't have to guess every column on every parse
+#the repetitive text answers are read straight into categoricals, which store each answer once
+SURVEY_DTYPES = {
+    "Timestamp": str,
+    "Age": "float64",
+    "Hours per day": "float64",
+    "BPM": "float64",
+    **{column: "category" for column in YES_NO_COLUMNS + NOMINAL_COLUMNS},
+    **{column: FREQUENCY_DTYPE for column in FREQUENCY_COLUMNS},
+    **{column: "float64" for column in MH_COLUMNS},
+}
+
+SONGS_DTYPES = {
+    "artist": str,
+    "song": str,
+    "duration_ms": "int64",
+    "explicit": "bool",
+    "year": "int64",
+    "popularity": "int64",
+    "danceability": "float64",
+    "energy": "float64",
+    "key": "int64",
+    "loudness": "float64",
+    "mode": "int64",
+    "speechiness": "float64",
+    "acousticness": "float64",
+    "instrumentalness": "float64",
+    "liveness": "float64",
+    "valence": "float64",
+    "tempo": "float64",
+    "genre": str,
+}
+
+#process-wide cache shared by every Streamlit session and rerun
+#(path, mtime, content hash) -> parsed frame
+_frames = {}
+#(path, mtime, size) -> content hash, so an unchanged file is only hashed once
+_hashes = {}
+_lock = threading.Lock()
+_key_locks = {}
+
+
+def file_hash(path, chunk_size=1 << 20):
+    #hash the file contents in chunks so big exports don't need to fit in memory twice
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_version(path):
+    #the cache key for a file: where it is, when it was written, and what's in it
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stat_key = (path, stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        content_hash = _hashes.get(stat_key)
+    if content_hash is None:
+        content_hash = file_hash(path)
+        with _lock:
+            _hashes[stat_key] = content_hash
+    return (path, stat.st_mtime_ns, content_hash)
+
+
+def _load(path, dtypes, copy):
+    key = file_version(path)
+
+    with _lock:
+        frame = _frames.get(key)
+        if frame is None:
+            key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    if frame is None:
+        #only one session parses a given file version, everyone else waits for it
+        with key_lock:
+            with _lock:
+                frame = _frames.get(key)
+            if frame is None:
+                frame = pd.read_csv(path, dtype=dtypes)
+                with _lock:
+                    #drop older versions of the same file so the cache doesn't grow forever
+                    for old_key in [k for k in _frames if k[0] == key[0] and k != key]:
+                        del _frames[old_key]
+                        _key_locks.pop(old_key, None)
+                    _frames[key] = frame
+
+    #callers edit their frames in place, so hand out a copy unless they promise not to
+    return frame.copy() if copy else frame
+
+
+def load_survey(path=SURVEY_PATH, copy=True):
+    return _load(path, SURVEY_DTYPES, copy)
+
+
+def load_songs(path=SONGS_PATH, copy=True):
+    return _load(path, SONGS_DTYPES, copy)
+
+
+def iter_survey(path=SURVEY_PATH, columns=None, chunk_size=100_000):
+    #the survey as a stream of frames of at most chunk_size rows, for exports too big to load at once
+    #(never cached, and only the listed columns are parsed)
+    dtypes = SURVEY_DTYPES if columns is None else {column: SURVEY_DTYPES[column] for column in columns}
+    with pd.read_csv(path, dtype=dtypes, usecols=columns, chunksize=chunk_size) as reader:
+        for chunk in reader:
+            yield chunk if columns is None else chunk[columns]
+
+
+def clear_cache():
+    with _lock:
+        _frames.clear()
+        _hashes.clear()
+        _key_locks.clear()
@@ -0,0 +1,163 @@
+#rendered-figure cache shared by every session: a chart is drawn once per version of its data
+#and parameters, and reruns just send the stored PNG (matplotlib/seaborn) or JSON spec (plotly)
+#
+#a chart is a small function that draws it, e.g.
+#
+#   def draw():
+#       plt.figure(figsize=(10, 6))
+#       sns.countplot(x="Fav genre", data=cleaned_data)
+#   figures.pyplot(draw)
+#
+#its cache key is the function's code plus a fingerprint of every value it uses from the
+#enclosing section (the frames it plots, the options it was given), so new data or a changed
+#chart always misses the cache, and anything else is served without re-rendering. Stage outputs
+#the pipeline hands out shared (get(..., copy=False)) are keyed on their stage's version; any other
+#frame is hashed row by row, so charts over copies should close over just the columns they plot
+import hashlib
+import io
+import pickle
+import threading
+import types
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import pipeline
+
+#total size of the cached figures, beyond which the least recently used ones are dropped
+MAX_BYTES = 64 * 2**20
+
+
+class FigureCache:
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        #key -> bytes or str, oldest first
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item
+
+    def put(self, key, item):
+        with self._lock:
+            if key in self._items:
+                self.size -= len(self._items.pop(key))
+            self._items[key] = item
+            self.size += len(item)
+            while self.size > self.max_bytes and len(self._items) > 1:
+                _, old = self._items.popitem(last=False)
+                self.size -= len(old)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._items)
+
+
+cache = FigureCache()
+
+
+def fingerprint(value, digest=None, _functions=()):
+    #a hash of a value's contents: frames and arrays are hashed by their data, not their identity
+    #(_functions are the functions whose closures are being hashed, so one that refers to itself
+    #doesn't recurse forever)
+    digest = digest or hashlib.blake2b(digest_size=16)
+    version = pipeline.shared_version(value)
+    if version is not None:
+        #a pipeline output shared with the sections (which don't edit those), frame or not: its stage
+        #version is enough, and costs nothing however many rows it has
+        digest.update(repr(("stage", version)).encode())
+    elif isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        digest.update(repr((type(value).__name__, value.shape)).encode())
+        if isinstance(value, pd.DataFrame):
+            digest.update(repr((list(value.columns), [str(dtype) for dtype in value.dtypes])).encode())
+        else:
+            digest.update(repr((value.name, str(value.dtype))).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=not isinstance(value, pd.Index)).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            fingerprint(item, digest, _functions)
+    elif isinstance(value, dict):
+        digest.update(f"dict{len(value)}".encode())
+        for key, item in value.items():
+            fingerprint(key, digest, _functions)
+            fingerprint(item, digest, _functions)
+    elif isinstance(value, types.FunctionType) and value in _functions:
+        digest.update(f"<recursive {_functions.index(value)}>".encode())
+    elif isinstance(value, types.FunctionType):
+        code = value.__code__
+        digest.update(repr((code.co_filename, code.co_qualname, code.co_code, code.co_consts)).encode())
+        for cell in value.__closure__ or ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:
+                #a name the function uses that isn't bound yet (assigned after the def)
+                digest.update(b"<empty cell>")
+                continue
+            fingerprint(contents, digest, _functions + (value,))
+    elif isinstance(value, (str, bytes, int, float, bool, type(None))):
+        digest.update(repr(value).encode())
+    else:
+        #anything else is keyed on its pickled contents, or failing that on the object itself
+        try:
+            digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            digest.update(f"{type(value).__qualname__}@{id(value)}".encode())
+    return digest
+
+
+def figure_key(draw, *params):
+    return fingerprint((draw, params)).hexdigest()
+
+
+def pyplot(draw, *params, dpi=200):
+    #show a matplotlib/seaborn chart, drawing it only if this version of it isn't cached
+    #draw() draws on a new current figure (or returns the figure it made)
+    import matplotlib.pyplot as plt
+
+    key = figure_key(draw, *params)
+    png = cache.get(key)
+    if png is None:
+        fig = draw()
+        if fig is None or fig is plt:
+            fig = plt.gcf()
+        #the same rendering st.pyplot does
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", bbox_inches="tight", dpi=dpi)
+        plt.close(fig)
+        png = buffer.getvalue()
+        cache.put(key, png)
+    st.image(png)
+
+
+def plotly_chart(build, *params):
+    #show a plotly chart, building the figure only if this version of it isn't cached
+    #build() returns the figure
+    import plotly.io as pio
+
+    key = figure_key(build, *params)
+    spec = cache.get(key)
+    if spec is None:
+        spec = build().to_json()
+        cache.put(key, spec)
+    st.plotly_chart(pio.from_json(spec, skip_invalid=True))
@@ -0,0 +1,34 @@
+#annotated heatmaps as one plotly trace
+#ff.create_annotated_heatmap adds a layout annotation per cell, so an 18x18 matrix is 324 objects
+#and a 100x100 one 10,000, each positioned separately by the browser. Here the values are rounded
+#on the server and drawn by the heatmap trace itself (texttemplate), and only the cells worth reading
+#(above a magnitude threshold, or picked by a mask such as "significant") get a label
+import numpy as np
+import plotly.graph_objects as go
+
+
+def labels(z, decimals=2, threshold=0.0, show=None):
+    #cell text: the rounded value where |value| >= threshold (and show, if given), else ""
+    rounded = np.round(np.asarray(z, dtype=float), decimals)
+    keep = np.isfinite(rounded) & (np.abs(rounded) >= threshold)
+    if show is not None:
+        keep &= np.asarray(show, dtype=bool)
+    #-0.0 would print with its sign
+    text = np.char.mod(f"%.{decimals}f", rounded + 0.0)
+    return np.where(keep, text, "").tolist()
+
+
+def annotated_heatmap(z, x, y, colorscale="Viridis", decimals=2, threshold=0.0, show=None, zmin=None, zmax=None):
+    #stands in for ff.create_annotated_heatmap(z=z, x=x, y=y, colorscale=colorscale)
+    z = np.asarray(z, dtype=float)
+    fig = go.Figure(go.Heatmap(
+        #float32 is plenty for colours, and half the payload
+        z=np.round(z, decimals).astype(np.float32), x=list(x), y=list(y),
+        text=labels(z, decimals, threshold, show), texttemplate="%{text}",
+        hovertemplate=f"%{{y}} / %{{x}}: %{{z:.{decimals}f}}<extra></extra>",
+        colorscale=colorscale, zmin=zmin, zmax=zmax, showscale=False))
+    #the same axes as the figure factory: labels on top, one tick per row/column
+    fig.update_layout(
+        xaxis=dict(ticks="", dtick=1, side="top"),
+        yaxis=dict(ticks="", dtick=1, ticksuffix="  "))
+    return fig
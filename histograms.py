@@ -0,0 +1,54 @@
+#histograms whose rows are counted here instead of in the browser
+#px.histogram sends every row to the page (the MH chart sends four values per survey answer), so
+#the chart, and every cached copy of it, grows with the survey. Here the rows are counted per
+#distinct value (and colour) and plotly just sums the counts into its bins; for a numeric x the
+#bin width plotly.js would have picked from all the rows is worked out here and passed along,
+#so the bars come out the same as before
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+COUNT = "count"
+
+
+def _round_up(value, steps):
+    #Lib.roundUp: the first step above value
+    return steps[min(np.searchsorted(steps, value, side="right"), len(steps) - 1)]
+
+
+def _round_down(value, steps):
+    #Lib.roundUp(..., reverse=true): the last step at or below value
+    return steps[max(np.searchsorted(steps, value, side="right") - 1, 0)]
+
+
+def auto_bin_size(values):
+    #plotly.js's automatic bin width (Axes.autoBin without nbins): the smallest gap between values
+    #rounded down to .9/1.9/4.9/9.9, or 2 std / n^0.4 if that's wider, then rounded up to a 1/2/5 step
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    distinct = np.unique(values)
+    if len(distinct) < 2:
+        return None
+    min_diff = np.diff(distinct).min()
+    base = 10 ** np.floor(np.log10(min_diff))
+    smallest = base * _round_down(min_diff / base, [0.9, 1.9, 4.9, 9.9])
+    rough = max(smallest, 2 * values.std() / len(values) ** 0.4)
+    base = 10 ** np.floor(np.log10(rough))
+    return float(base * _round_up(rough / base, [2, 5, 10]))
+
+
+def histogram(frame, x, color=None, **options):
+    #stands in for px.histogram(frame, x=x, color=color, **options)
+    columns = [x] if color is None else [x, color]
+    #first-appearance order, so the colours come out in the order px would give them
+    counts = frame.groupby(columns, sort=False, observed=True).size().reset_index(name=COUNT)
+    fig = px.histogram(counts, x=x, y=COUNT, color=color, histfunc="sum", **options)
+    if pd.api.types.is_numeric_dtype(frame[x]):
+        size = auto_bin_size(frame[x])
+        if size is not None:
+            fig.update_traces(xbins=dict(size=size))
+    #the axis and hover text read as they did over the rows
+    fig.update_layout(yaxis_title=COUNT)
+    for trace in fig.data:
+        trace.hovertemplate = trace.hovertemplate.replace(f"sum of {COUNT}", COUNT)
+    return fig
@@ -0,0 +1,44 @@
+#modules that are only imported the first time something in them is used, so a section
+#only pays for the libraries it actually draws with (seaborn alone takes well over a second)
+#every deferred import is timed, for the per-section import report in benchmarks.py
+import importlib
+import sys
+import threading
+import time
+
+#module name -> seconds its (first) import took
+import_times = {}
+_lock = threading.Lock()
+
+
+def load(name):
+    #import a module now, timing it if this is the first import in the process
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with _lock:
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        import_times.setdefault(name, time.perf_counter() - start)
+    return module
+
+
+class LazyModule:
+    #stands in for a module until one of its attributes is first looked up
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = load(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy(name):
+    return LazyModule(name)
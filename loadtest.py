@@ -0,0 +1,209 @@
+#load test for service.py: keeps a number of HTTP/1.1 keep-alive connections busy with a mix of
+#recommendation requests for a while, and reports throughput and latency percentiles
+#
+#   python loadtest.py --spawn                          start the service, test it, stop it
+#   python loadtest.py --url http://127.0.0.1:8000      test a service that's already running
+#   python loadtest.py --spawn --connections 64 --duration 30 --server uvicorn
+#   python loadtest.py --spawn --record                 also append the result to the benchmark history
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import quote, urlencode, urlsplit
+
+import numpy as np
+
+from recommender import GOALS
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+CONNECTIONS = 32
+DURATION = 10.0
+WARMUP = 1.0
+
+
+def request_mix(base_url):
+    #the paths to cycle through: every goal's genres and songs, every genre's songs, and
+    #"more like this" for a few of each goal's top songs (taken from the service itself)
+    paths = ["/health", "/goals"]
+    for goal in GOALS:
+        paths.append("/genres?" + urlencode({"goal": goal}))
+        for k in (5, 10, 25):
+            paths.append("/songs?" + urlencode({"goal": goal, "k": k}))
+    for goal in GOALS:
+        status, body = asyncio.run(_fetch(base_url, "/genres?" + urlencode({"goal": goal})))
+        for genre in json.loads(body)["genres"]:
+            paths.append(f"/genres/{quote(genre['genre'])}/songs?k=10")
+        status, body = asyncio.run(_fetch(base_url, "/songs?" + urlencode({"goal": goal, "k": 5})))
+        for song in json.loads(body)["songs"]:
+            paths.append("/similar?" + urlencode({"artist": song["artist"], "song": song["song"], "goal": goal}))
+    return paths
+
+
+async def _fetch(base_url, path):
+    reader, writer = await _connect(base_url)
+    try:
+        return await _request(reader, writer, urlsplit(base_url).netloc, path)
+    finally:
+        writer.close()
+
+
+async def _connect(base_url):
+    parts = urlsplit(base_url)
+    return await asyncio.open_connection(parts.hostname, parts.port or 80)
+
+
+async def _request(reader, writer, host, path):
+    #one GET on an open keep-alive connection; returns (status, body)
+    writer.write(f"GET {path} HTTP/1.1\r\nhost: {host}\r\n\r\n".encode())
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.split(b"\r\n")
+    status = int(lines[0].split(b" ", 2)[1])
+    length = 0
+    for line in lines[1:]:
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def _worker(base_url, paths, offset, deadline, record_after, latencies, failures):
+    host = urlsplit(base_url).netloc
+    reader, writer = await _connect(base_url)
+    i = offset
+    try:
+        while True:
+            start = time.perf_counter()
+            if start >= deadline:
+                return
+            path = paths[i % len(paths)]
+            i += 1
+            try:
+                status, _ = await _request(reader, writer, host, path)
+            except (ConnectionError, asyncio.IncompleteReadError) as error:
+                failures.append(f"{path}: {type(error).__name__}")
+                writer.close()
+                reader, writer = await _connect(base_url)
+                continue
+            end = time.perf_counter()
+            if start >= record_after:
+                latencies.append(end - start)
+                if status != 200:
+                    failures.append(f"{path}: HTTP {status}")
+    finally:
+        writer.close()
+
+
+async def _run(base_url, paths, connections, duration, warmup):
+    #the first `warmup` seconds aren't counted (connections opening, caches filling)
+    latencies, failures = [], []
+    start = time.perf_counter()
+    record_after = start + warmup
+    deadline = record_after + duration
+    #each connection starts at a different point of the mix
+    await asyncio.gather(*(
+        _worker(base_url, paths, i * len(paths) // connections, deadline, record_after, latencies, failures)
+        for i in range(connections)))
+    return latencies, failures
+
+
+def run(base_url, connections=CONNECTIONS, duration=DURATION, warmup=WARMUP):
+    paths = request_mix(base_url)
+    latencies, failures = asyncio.run(_run(base_url, paths, connections, duration, warmup))
+    latencies = np.array(latencies) * 1000
+    result = {
+        "url": base_url,
+        "connections": connections,
+        "duration_s": duration,
+        "paths": len(paths),
+        "requests": len(latencies),
+        "requests_per_s": len(latencies) / duration,
+        "failures": len(failures),
+    }
+    if len(latencies):
+        for name, q in (("p50_ms", 50), ("p90_ms", 90), ("p99_ms", 99), ("p999_ms", 99.9)):
+            result[name] = float(np.percentile(latencies, q))
+        result["max_ms"] = float(latencies.max())
+    return result, failures
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def spawn(port, server="builtin", timeout=120):
+    #start service.py in its own process and wait until it answers
+    process = subprocess.Popen([sys.executable, os.path.join(REPO_DIR, "service.py"), "--port", str(port),
+                                "--server", server], cwd=REPO_DIR)
+    base_url = f"http://127.0.0.1:{port}"
+    stop = time.time() + timeout
+    while time.time() < stop:
+        if process.poll() is not None:
+            raise RuntimeError(f"service.py exited with code {process.returncode}")
+        try:
+            status, _ = asyncio.run(_fetch(base_url, "/health"))
+            if status == 200:
+                return process, base_url
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"service.py didn't answer within {timeout}s")
+
+
+def record(result, server, history=None):
+    #append to the benchmark history (see benchmarks.py) as a "service" measurement whose wall_s
+    #is the p99 latency, so benchmarks.py --compare tracks it across commits
+    import benchmarks
+
+    history = history or benchmarks.HISTORY_PATH
+    commit, dirty = benchmarks.git_commit()
+    entry = {"commit": commit, "dirty": dirty, "kind": "service", "name": f"recommendations ({server})",
+             "scale": 1, "synthetic": False, "wall_s": result.get("p99_ms", 0) / 1000, "peak_bytes": None,
+             "errors": [], **result}
+    os.makedirs(os.path.dirname(os.path.abspath(history)), exist_ok=True)
+    with open(history, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def report(result, failures):
+    print(f"{result['requests']} requests over {result['connections']} connections in {result['duration_s']:.0f}s "
+          f"({result['paths']} distinct paths)")
+    print(f"  {result['requests_per_s']:,.0f} requests/s")
+    if result["requests"]:
+        print("  latency  " + "  ".join(f"{name[:-3]} {result[name]:.2f} ms"
+                                        for name in ("p50_ms", "p90_ms", "p99_ms", "p999_ms", "max_ms")))
+    if failures:
+        print(f"  {len(failures)} failures, e.g. {failures[0]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the recommendation service.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="a running service to test")
+    parser.add_argument("--spawn", action="store_true", help="start service.py on a free port and test that")
+    parser.add_argument("--server", choices=["builtin", "uvicorn"], default="builtin",
+                        help="HTTP server for --spawn")
+    parser.add_argument("--connections", type=int, default=CONNECTIONS)
+    parser.add_argument("--duration", type=float, default=DURATION, help="seconds measured (after the warmup)")
+    parser.add_argument("--warmup", type=float, default=WARMUP)
+    parser.add_argument("--record", action="store_true", help="append the result to the benchmark history")
+    args = parser.parse_args()
+
+    process = None
+    base_url = args.url
+    if args.spawn:
+        process, base_url = spawn(free_port(), args.server)
+    try:
+        result, failures = run(base_url, args.connections, args.duration, args.warmup)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    report(result, failures)
+    if args.record:
+        record(result, args.server)
+    sys.exit(1 if failures else 0)
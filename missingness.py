@@ -0,0 +1,73 @@
+#missing-value overview that costs the same to draw at 700 rows or 70M
+#one pass over each column collects its null count, the runs of consecutive nulls, and the share
+#of nulls in each of a fixed number of row bins; the heatmap is drawn from the bins, so its size
+#(and the memory behind it) depends on BINS and the number of columns, not on the number of rows
+import numpy as np
+import pandas as pd
+
+#row bins across the heatmap (a frame with fewer rows gets one bin per row, like the full view)
+BINS = 400
+
+
+class MissingSummary:
+
+    def __init__(self, columns, rows, counts, segments, binned, edges):
+        self.columns = columns
+        self.rows = rows
+        #nulls per column
+        self.counts = counts
+        #column -> (starts, lengths) of its runs of consecutive nulls
+        self.segments = segments
+        #columns x bins share of nulls in each bin, and the row each bin starts at (plus the end)
+        self.binned = binned
+        self.edges = edges
+
+    def table(self):
+        #null count, percent and number of null runs per column
+        return pd.DataFrame({
+            "missing": self.counts,
+            "percent": 100 * self.counts / max(self.rows, 1),
+            "runs": [len(self.segments[column][0]) for column in self.columns],
+        }, index=pd.Index(self.columns))
+
+
+def null_runs(mask):
+    #(starts, lengths) of the runs of True in a boolean array
+    padded = np.concatenate([[False], mask, [False]]).view(np.int8)
+    changes = np.flatnonzero(np.diff(padded))
+    starts, ends = changes[::2], changes[1::2]
+    return starts, ends - starts
+
+
+def summarize(frame, bins=BINS):
+    rows = len(frame)
+    n_bins = max(min(bins, rows), 1)
+    edges = np.linspace(0, rows, n_bins + 1).astype(np.int64)
+    widths = np.maximum(np.diff(edges), 1)
+
+    counts = np.zeros(len(frame.columns), dtype=np.int64)
+    binned = np.zeros((len(frame.columns), n_bins))
+    segments = {}
+    #one column at a time, so only one rows-long mask is ever alive
+    for i, column in enumerate(frame.columns):
+        mask = frame[column].isna().to_numpy()
+        counts[i] = mask.sum()
+        segments[column] = null_runs(mask)
+        if rows:
+            binned[i] = np.add.reduceat(mask.view(np.int8), edges[:-1]) / widths
+    return MissingSummary(list(frame.columns), rows, counts, segments, binned, edges)
+
+
+def plot(summary, title, xlabel):
+    #the binned heatmap: 1 where every row in a bin is missing the value, 0 where none are
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(12, 6))
+    plt.imshow(summary.binned, interpolation='nearest', aspect='auto', cmap='viridis', vmin=0, vmax=1,
+               extent=(0, max(summary.rows, 1), len(summary.columns) - 0.5, -0.5))
+    plt.xlabel(xlabel)
+    plt.ylabel('Features')
+    plt.title(title)
+    plt.yticks(range(len(summary.columns)), summary.columns)
+    plt.xticks(np.linspace(0, max(summary.rows - 1, 0), min(10, max(summary.rows, 1))).astype(int))
+    plt.grid(True, axis='y', linestyle='--', alpha=0.7)
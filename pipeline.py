@@ -0,0 +1,224 @@
+#one staged cleaning pipeline shared by every section of the app
+#each stage's output is memoized on its inputs, so asking for a stage only runs
+#the stages that haven't been computed for the current version of the data
+import threading
+import weakref
+
+import pandas as pd
+
+import aggregates
+import cleaning
+import correlation
+import data_loader
+import missingness
+import recommender
+import similarity
+import snapshots
+
+#stage name -> (parent stage, function that turns the parent's output into this stage's output)
+#a stage with several parents lists them in a tuple and its function takes one argument per parent
+#the two roots ("survey" and "songs") come straight from the loader
+SURVEY_STAGES = {
+    "bpm_imputed": ("survey", cleaning.fill_bpm),
+    "outliers_removed": ("bpm_imputed", cleaning.remove_outliers),
+    "frequencies_recoded": ("outliers_removed", cleaning.encode_survey),
+    "genres_downsampled": ("frequencies_recoded", cleaning.downsample_genres),
+    "anxiety_balanced": ("genres_downsampled", cleaning.balance_anxiety),
+    "cleaned_data": ("anxiety_balanced", cleaning.balance_depression),
+    #genre x frequency x measure aggregates; mh_by_genre is the Very frequently slice of the cube
+    #Get Recommendations uses the data before rebalancing, Explore the fully cleaned data
+    "frequency_cube": ("frequencies_recoded", aggregates.frequency_cube),
+    "mh_by_genre": ("frequency_cube", aggregates.genre_averages),
+    "cleaned_frequency_cube": ("cleaned_data", aggregates.frequency_cube),
+    "cleaned_mh_by_genre": ("cleaned_frequency_cube", aggregates.genre_averages),
+    #the same cells' box plot statistics (quartiles, whiskers, outliers), for Explore's box plots
+    "cleaned_box_cube": ("cleaned_data", aggregates.box_cube),
+    "effect_df": ("mh_by_genre", aggregates.effect_table),
+    #Pearson/Spearman/Kendall sums over the cleaned data's numeric columns, for Explore's heatmaps
+    "cleaned_correlations": ("cleaned_data", correlation.correlations),
+    #per-column null counts and binned null shares, for the missing-value heatmaps
+    "survey_missing": ("survey", missingness.summarize),
+    "bpm_imputed_missing": ("bpm_imputed", missingness.summarize),
+}
+
+SONG_STAGES = {
+    "songs_clean": ("songs", cleaning.remove_explicit),
+    "songs_exploded": ("songs_clean", cleaning.explode_genres),
+    "songs_expanded": ("songs_exploded", cleaning.normalize_genres),
+    "songs_balanced": ("songs_expanded", cleaning.balance_valence),
+    #the effect_df x songs_expanded join, indexed for recommendations
+    "song_index": (("effect_df", "songs_expanded"), recommender.SongIndex),
+    #KD-trees over the songs' audio features for "more like this"
+    "similarity_index": ("songs_expanded", similarity.SimilarityIndex),
+    "songs_missing": ("songs", missingness.summarize),
+}
+
+#stages that can also be built straight from the survey CSV a chunk at a time, without
+#ever loading the whole table (used when the pipeline is given a chunk_size)
+STREAMED_STAGES = {
+    "frequency_cube": ("survey", aggregates.stream_frequency_cube),
+}
+
+#stages worth writing to disk so a cold start doesn't need the CSV parser
+SNAPSHOT_STAGES = ("cleaned_data", "songs_expanded", "frequency_cube", "mh_by_genre", "similarity_index")
+
+
+class CleaningPipeline:
+
+    def __init__(self, survey_path=data_loader.SURVEY_PATH, songs_path=data_loader.SONGS_PATH,
+                 snapshot_store=None, snapshot_stages=SNAPSHOT_STAGES, chunk_size=None):
+        self.snapshot_store = snapshot_store
+        #streamed stages read their source in chunks of this many rows instead of from the loaded table
+        self.chunk_size = chunk_size
+        self.snapshot_stages = set(snapshot_stages)
+        self.roots = {
+            "survey": (survey_path, data_loader.load_survey),
+            "songs": (songs_path, data_loader.load_songs),
+        }
+        self.stages = {**SURVEY_STAGES, **SONG_STAGES}
+        #stage name -> (input key, output)
+        self._memo = {}
+        #id of every output handed out shared (copy=False) -> (weak reference to it, its content key)
+        self._shared = {}
+        #guards the dicts above; each stage is computed under its own lock, so a cold build of one
+        #stage doesn't hold up sessions asking for stages that are already memoized
+        self._lock = threading.RLock()
+        #stage name -> lock held while that stage is computed
+        self._stage_locks = {}
+
+    def stage_names(self):
+        return list(self.roots) + list(self.stages)
+
+    def key(self, name):
+        #a stage's key is its name plus the key of everything upstream of it,
+        #bottoming out at the version (path, mtime, content hash) of the source file
+        if name in self.roots:
+            path, _ = self.roots[name]
+            return (name, data_loader.file_version(path))
+        return (name,) + tuple(self.key(parent) for parent in self.parents(name))
+
+    def parents(self, name):
+        if name not in self.stages:
+            raise KeyError(f"Unknown pipeline stage: {name}")
+        parents, _ = self.stages[name]
+        return (parents,) if isinstance(parents, str) else tuple(parents)
+
+    def content_key(self, key):
+        #the same key with only the content hashes of the source files, so snapshots
+        #stay valid when a file is copied or touched without being changed
+        name = key[0]
+        if name in self.roots:
+            return (name, key[1][2])
+        return (name,) + tuple(self.content_key(upstream) for upstream in key[1:])
+
+    def _compute(self, name, key):
+        if name in self.roots:
+            path, load = self.roots[name]
+            return load(path, copy=False)
+
+        snapshotted = self.snapshot_store is not None and name in self.snapshot_stages
+        if snapshotted:
+            output = self.snapshot_store.load(name, self.content_key(key))
+            if output is not None:
+                return output
+
+        if self.chunk_size is not None and name in STREAMED_STAGES:
+            root, stream = STREAMED_STAGES[name]
+            output = stream(self.roots[root][0], self.chunk_size)
+        else:
+            _, func = self.stages[name]
+            inputs = [self._get(parent, upstream) for parent, upstream in zip(self.parents(name), key[1:])]
+            output = func(*inputs)
+        if snapshotted:
+            self.snapshot_store.save(name, self.content_key(key), output)
+        return output
+
+    def _get(self, name, key):
+        with self._lock:
+            memo = self._memo.get(name)
+            if memo is not None and memo[0] == key:
+                return memo[1]
+            stage_lock = self._stage_locks.setdefault(name, threading.Lock())
+
+        #only one session computes a given stage, everyone else waits for it
+        #(stages only ever wait on their parents, so the locks are always taken in the same order)
+        with stage_lock:
+            with self._lock:
+                memo = self._memo.get(name)
+            if memo is not None and memo[0] == key:
+                return memo[1]
+            output = self._compute(name, key)
+            with self._lock:
+                #only the latest version of each stage is kept
+                self._memo[name] = (key, output)
+            return output
+
+    def get(self, name, copy=True):
+        #sections edit the frames they get back, so they get a copy unless they promise not to
+        #(stages that build lookup objects rather than frames are shared as-is)
+        key = self.key(name)
+        output = self._get(name, key)
+        if copy and isinstance(output, (pd.DataFrame, pd.Series)):
+            return output.copy()
+        self._remember(output, key)
+        return output
+
+    def _remember(self, output, key):
+        #shared outputs are never edited, so the version of the stage stands in for their contents
+        #(figures.py keys cached charts on it instead of hashing every row on every rerun)
+        ident = id(output)
+        with self._lock:
+            entry = self._shared.get(ident)
+            if entry is not None and entry[0]() is output:
+                return
+            try:
+                ref = weakref.ref(output, lambda ref: self._forget(ident, ref))
+            except TypeError:
+                return
+            self._shared[ident] = (ref, self.content_key(key))
+
+    def _forget(self, ident, ref):
+        with self._lock:
+            if self._shared.get(ident, (None,))[0] is ref:
+                del self._shared[ident]
+
+    def version(self, value):
+        #the content key of the stage `value` was handed out shared from, or None if it wasn't
+        entry = self._shared.get(id(value))
+        if entry is None or entry[0]() is not value:
+            return None
+        return entry[1]
+
+    def snapshot(self, name):
+        #the on-disk snapshot of a stage, for reading only the columns you need
+        #(None if the stage isn't snapshotted or pyarrow isn't installed)
+        if self.snapshot_store is None or name not in self.snapshot_stages:
+            return None
+        content_key = self.content_key(self.key(name))
+        snapshot = self.snapshot_store.open(name, content_key)
+        if snapshot is None:
+            self.get(name, copy=False)
+            snapshot = self.snapshot_store.open(name, content_key)
+        return snapshot
+
+    def clear(self):
+        with self._lock:
+            self._memo.clear()
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def shared_version(value):
+    #version() of the process-wide pipeline, without creating it
+    return None if _default is None else _default.version(value)
+
+
+def default_pipeline():
+    #the process-wide pipeline every Streamlit session shares
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = CleaningPipeline(snapshot_store=snapshots.SnapshotStore())
+        return _default
@@ -0,0 +1,67 @@
+#song-level recommendations: the effect_df x songs_expanded join, built once and indexed
+
+#listening goal -> the genre Effect that serves it
+#Effect is 1 when a genre's very frequent listeners average a depression score of 5 or more
+GOALS = {"Mood Increase": 0, "Mood Decrease": 1}
+
+#what a recommendation shows the user
+SONG_COLUMNS = ["artist", "song", "genre", "year", "popularity"]
+
+
+class SongIndex:
+    #songs grouped by (genre, Effect) and by Effect alone, each list presorted by popularity,
+    #so a recommendation is just the first k rows of a list that already exists
+
+    def __init__(self, effect_df, songs_expanded):
+        effects = effect_df.set_index("Genre")["Effect"]
+        self.effects = effects.to_dict()
+
+        #join the two datasets by their mutual column (genre)
+        #songs whose genre isn't one of the survey's genres have no Effect and are left out
+        songs = songs_expanded.assign(Effect=songs_expanded["genre"].astype("object").map(effects))
+        songs = songs.dropna(subset=["Effect"]).astype({"Effect": "int8"})
+        songs = songs.sort_values("popularity", ascending=False, kind="stable").reset_index(drop=True)
+        self.songs = songs
+        self._index()
+
+    def _index(self):
+        songs = self.songs
+        self.by_genre = {
+            key: frame.reset_index(drop=True)
+            for key, frame in songs.groupby(["genre", "Effect"], observed=True, sort=False)}
+
+        #a pop-rock song is listed under both genres, but should only be recommended once per goal
+        self.by_effect = {
+            effect: frame.drop_duplicates(["artist", "song"]).reset_index(drop=True)
+            for effect, frame in songs.groupby("Effect", sort=False)}
+
+        self.genres_by_effect = {
+            effect: sorted(genre for genre, e in self.effects.items() if e == effect) for effect in GOALS.values()}
+
+        self._empty = songs.iloc[:0]
+
+    def update_effects(self, effects):
+        #move the songs of any genre whose Effect changed (e.g. the genres an
+        #aggregates.AggregateStore append reports) to their new goal; returns those genres
+        changed = {genre: effect for genre, effect in effects.items()
+                   if genre in self.effects and self.effects[genre] != effect}
+        if changed:
+            self.effects.update(changed)
+            moved = self.songs["genre"].isin(list(changed))
+            songs = self.songs.copy()
+            songs.loc[moved, "Effect"] = songs.loc[moved, "genre"].astype("object").map(changed).astype("int8")
+            self.songs = songs
+            self._index()
+        return list(changed)
+
+    def genres(self, goal):
+        return self.genres_by_effect[GOALS[goal]]
+
+    def recommend(self, goal, k=10):
+        #the k most popular songs from every genre that serves the listening goal
+        return self.by_effect.get(GOALS[goal], self._empty).iloc[:k]
+
+    def recommend_genre(self, genre, k=10):
+        #the k most popular songs from one genre
+        key = (genre, self.effects.get(genre))
+        return self.by_genre.get(key, self._empty).iloc[:k]
@@ -0,0 +1,311 @@
+#Clean The Data: every cleaning step of the shared pipeline, with before/after views
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import figures
+import missingness
+from cleaning import unmapped_genres
+from pipeline import default_pipeline
+
+
+def render():
+    st.title("Clean The Data")
+
+    #every step below is a stage of the shared pipeline, so reruns just look them up
+    pipeline = default_pipeline()
+
+    #load the Data
+    mxmh_survey_results = pipeline.get("survey", copy=False)
+    
+    #handle missing vals 
+    st.subheader("Handle BPM Missing Values")
+    st.markdown("Group by genre, then replace with median of genre")
+
+    #get pop median so we can test our replacement worked
+    pop_median = mxmh_survey_results[mxmh_survey_results["Fav genre"] == "Pop"]["BPM"].median()
+    st.write(f"The median BPM of Pop: {pop_median}")
+
+    #group and replace
+    mxmh_survey_results = pipeline.get("bpm_imputed", copy=False)
+
+    #see that the values were replaced
+    filtered_data = mxmh_survey_results[mxmh_survey_results["Fav genre"] == "Pop"]
+    st.write(filtered_data.head())  
+
+    #see that BPM has no missing values
+    #missing vals
+    st.subheader("No More Missing BPM Vals")
+    #make a heatmap of the missing data
+    #(drawn from per-column null counts and a fixed number of row bins, so it's the same size at any row count)
+    missing = pipeline.get("bpm_imputed_missing", copy=False)
+    
+    def draw():
+        missingness.plot(missing, 'Visualizing Missing Values in mxmh_survey_results Dataset', 'mxmh_survey_results Index')
+    figures.pyplot(draw)
+
+    st.subheader("Handle Outliers")
+    #I don't trust the participants who say they listen to music 24hrs/day
+    #I will say the max they could realistically listen to is 16 hrs
+    #deleted 6 rows
+    st.markdown("Deleted all instances of Hours Per Day above 16. This deleted 6 rows of observations.")
+    st.write(mxmh_survey_results[(mxmh_survey_results["Hours per day"] < 16)].shape)
+
+    #take away age outliers 
+    cleaned_data = pipeline.get("outliers_removed", copy=False)
+    st.markdown("Deleted all instances of Age < 18 and Age > 64 (3 SDs from the 75% percentile). This deleted 50 rows of observations.")
+    st.write(cleaned_data.shape)
+    
+    #recode frequency genre
+    st.subheader("Recode Categorical Data")
+    st.markdown("Genre Frequencies")
+
+    cleaned_data = pipeline.get("frequencies_recoded", copy=False)
+
+    #make a subset so users can see the changes
+    frequency_columns = ["Frequency [Latin]", "Frequency [Rock]", "Frequency [Video game music]", "Frequency [Jazz]",
+    "Frequency [R&B]", "Frequency [K pop]", "Frequency [Country]", "Frequency [EDM]", "Frequency [Hip hop]",
+    "Frequency [Pop]", "Frequency [Rap]", "Frequency [Classical]", "Frequency [Metal]", "Frequency [Folk]",
+    "Frequency [Lofi]", "Frequency [Gospel]"]
+
+    frequency_subset = cleaned_data[frequency_columns]
+    
+    #see the changes
+    st.markdown("See these changes in the following subset:")
+    st.write(frequency_subset.head())  
+
+    st.subheader("Handle Imbalance")
+    st.markdown("Fav Genre")
+    st.write("* When deleting Age outliers, one Fav Genre was deleted (Latin). Now the remaining participants represent 15 favorite genres. I made Fav Genre more balanced by reducing the three outliers (rock, metal, pop) to have the mean count of Fav Genre (21). Please see these changes below.")
+    st.write("Imbalanced distribution before reducing outlier frequencies to the median frequency:")
+    
+    #count the occurrences of each genre
+    genre_counts = cleaned_data["Fav genre"].value_counts()
+    
+    #create the bar chart
+    def draw():
+        plt.figure(figsize=(10, 6))
+        plt.bar(genre_counts.index, genre_counts.values, color='skyblue', edgecolor='black')
+    
+        #set the title and labels
+        plt.title('Distribution of Fav Genre')
+        plt.xlabel('Fav Genre')
+        plt.ylabel('Count')
+        plt.xticks(rotation=45)
+    #display the plot
+    figures.pyplot(draw)
+
+    #reduce rock, metal, and pop to the median frequency
+    cleaned_data = pipeline.get("genres_downsampled")
+
+    st.write("Less imbalanced distribution after reducing outlier frequencies to the median frequency. Keeping the same y-axis range so the difference can be compared:")
+
+    #count the occurrences of each genre
+    genre_counts = cleaned_data["Fav genre"].value_counts()
+    
+    #create the bar chart
+    def draw():
+        plt.figure(figsize=(10, 6))
+        plt.bar(genre_counts.index, genre_counts.values, color='skyblue', edgecolor='black')
+    
+        #set the title and labels
+        plt.title('Distribution of Fav Genre')
+        plt.xlabel('Fav Genre')
+        plt.ylabel('Count')
+        plt.ylim(0, 140)
+        plt.xticks(rotation=45)
+    #display the plot
+    figures.pyplot(draw)
+
+    #######now anxiety balance
+    st.subheader("Handle imbalance of Anxiety")
+    st.write("I balanced anxiety by undersampling, considering two classes: values below 5 and above 5")
+    st.write("Before:")
+
+    #original before plot
+    #(cleaned_data is an edited copy, so the charts below only hold on to the column they plot,
+    #which is all figures.py has to hash to find them in its cache)
+    plotted = cleaned_data["Anxiety"]
+    def draw():
+        plt.figure(figsize=(10, 6))
+        plt.hist(plotted, bins=11, edgecolor='black')
+    
+        #set the title of the plot
+        plt.title('Distribution of Original Anxiety')
+    
+        #set the x-axis title
+        plt.xlabel('Anxiety Score')
+    figures.pyplot(draw)
+
+    #plot of binary before
+    cleaned_data["Anxiety_category"] = np.where(cleaned_data["Anxiety"] >= 5, 1, 0)
+    plotted = cleaned_data["Anxiety_category"]
+    def draw():
+        plt.figure(figsize=(10, 6))
+        plt.hist(plotted, bins=11, edgecolor='black')
+    
+        #set the title of the plot
+        plt.title('Distribution of Original Anxiety as a Binary')
+    
+        #set the x-axis title
+        plt.xlabel('Anxiety Below 5 (0) and Above 5 (1)')
+        plt.xticks([0, 1])
+    figures.pyplot(draw)
+
+    ##############balance anxiety
+    cleaned_data = pipeline.get("anxiety_balanced")
+
+    st.markdown("Binary Anxiety after handling imbalance:")
+
+    #remake this column so we can plot it
+    cleaned_data["Anxiety_category"] = np.where(cleaned_data["Anxiety"] >= 5, 1, 0)
+
+    
+    #plot of binary after
+
+    plotted = cleaned_data["Anxiety_category"]
+    def draw():
+        plt.figure(figsize=(10, 6))
+        plt.hist(plotted, bins=11, edgecolor='black')
+    
+        #set the title of the plot
+        plt.title('Distribution of Balanced Anxiety as a Binary')
+    
+        #set the x-axis title
+        plt.xlabel('Anxiety Below 5 (0) and Above 5 (1)')
+        plt.xticks([0, 1])
+    figures.pyplot(draw)
+
+    #drop that column again
+    cleaned_data = cleaned_data.drop(["Anxiety_category"], axis=1) 
+
+    #reset index just incase
+    cleaned_data.reset_index(drop=True, inplace=True)
+
+    ######now balance depression
+    st.subheader("Handle imbalance of Depression")
+    st.write("I balanced depression by undersampling, considering two classes: values below 5 and above 5")
+    st.write("Before:")
+    
+
+
+    #original before plot
+    plotted = cleaned_data["Depression"]
+    def draw():
+        plt.figure(figsize=(10, 6))
+        plt.hist(plotted, bins=11, edgecolor='black')
+    
+        #set the title of the plot
+        plt.title('Distribution of Original Depression')
+    
+        #set the x-axis title
+        plt.xlabel('Depression Score')
+    figures.pyplot(draw)
+
+    #plot of binary before
+    cleaned_data["Depression_category"] = np.where(cleaned_data["Depression"] >= 5, 1, 0)
+    plotted = cleaned_data["Depression_category"]
+    def draw():
+        plt.figure(figsize=(10, 6))
+        plt.hist(plotted, bins=11, edgecolor='black')
+    
+        #set the title of the plot
+        plt.title('Distribution of Original Depression as a Binary')
+    
+        #set the x-axis title
+        plt.xlabel('Depression Below 5 (0) and Above 5 (1)')
+        plt.xticks([0, 1])
+    figures.pyplot(draw)
+
+    ##############balance depression
+    cleaned_data = pipeline.get("cleaned_data")
+
+    st.markdown("Binary Depression after handling imbalance:")
+
+    #remake this column so we can plot it
+    cleaned_data["Depression_category"] = np.where(cleaned_data["Depression"] >= 5, 1, 0)
+
+    
+    #plot of binary after
+
+    plotted = cleaned_data["Depression_category"]
+    def draw():
+        plt.figure(figsize=(10, 6))
+        plt.hist(plotted, bins=11, edgecolor='black')
+    
+        #set the title of the plot
+        plt.title('Distribution of Balanced Depression as a Binary')
+    
+        #set the x-axis title
+        plt.xlabel('Depression Below 5 (0) and Above 5 (1)')
+        plt.xticks([0, 1])
+    figures.pyplot(draw)
+
+    #drop that column again
+    cleaned_data = cleaned_data.drop(["Depression_category"], axis=1) 
+
+    #reset index just in case
+    cleaned_data.reset_index(drop=True, inplace=True)
+
+
+
+    ###########see that I should stop balancing now
+
+    # st.markdown("Here, I decided not to balance OCD and insomnia because balancing depression made anxiety imbalanced again. (Please see the plot below.) This happened because undersampling deletes observations, so each time I use undersampling, the class balance is affected. So, I'll stop balancing here.")
+
+    st.markdown("For the final, I will balance OCD and insomnia.")
+
+    # #create the Anxiety_category column 
+    # cleaned_data["Anxiety_category"] = np.where(cleaned_data["Anxiety"] >= 5, 1, 0)
+    
+    # #create the plot
+    # fig, ax = plt.subplots(figsize=(10, 6))  
+    # sns.histplot(data=cleaned_data, x='Anxiety_category', ax=ax)
+    
+    # #set title and labels
+    # ax.set_title('Distribution of Anxiety After Balancing Depression')
+    # ax.set_xlabel('Anxiety Category')
+    # ax.set_ylabel('Count')
+    
+    # #display the plot 
+    # st.pyplot(fig)
+
+
+    st.markdown("Clean the second dataset")
+    st.write("Filter out all explicit songs so the app is appropriate for all users.")
+    songs = pipeline.get("songs_clean", copy=False)
+    st.write(songs.head())  
+
+    st.markdown("Some songs are categorized as multiple genres. Let's split that up so each song is listed once per genre that it classifies as. This will create duplicates. For example, I want a pop-rock song to be recommened for pop and rock recommedations.")
+
+    #explode the dataset so each genre gets its own row
+    ######explode() expands the list of genres so each genre has its own row, duplicating other information about the song.
+    songs_expanded = pipeline.get("songs_exploded", copy=False)
+    
+    #what does the dataset look like now
+    st.write(songs_expanded["genre"].head())  
+
+    #make sure genres are consistent
+    songs_expanded = pipeline.get("songs_expanded", copy=False)
+
+    st.markdown("I also edited the genre names to match the names in the first dataset.")
+    st.write(songs_expanded["genre"].head())  
+
+    st.markdown("These genres don't match any of the genres in the first dataset, so they won't be recommended:")
+    st.write(unmapped_genres(songs_expanded))
+            
+
+    st.markdown("Handle imbalance")
+    songs_balanced = pipeline.get("songs_balanced", copy=False)
+
+    # Create the plot
+    def draw():
+        fig, ax = plt.subplots()  # Initialize a Matplotlib figure and axis
+        sns.histplot(data=songs_balanced, x='valence_category', ax=ax)
+    
+        ax.set_title('Distribution of Binary Valence')
+        ax.set_xlabel('Valence Category')
+        ax.set_ylabel('Count')
+    # display the plot in Streamlit
+    figures.pyplot(draw)
@@ -0,0 +1,198 @@
+#Explore The Data: how listening habits relate to mental health in the cleaned data
+import streamlit as st
+import pandas as pd
+import matplotlib.pyplot as plt
+import plotly.express as px
+
+import figures
+import heatmaps
+import violins
+from aggregates import add_effect, box_stats
+from data_loader import FREQUENCY_COLUMNS, MH_COLUMNS
+from pipeline import default_pipeline
+
+
+def render():
+    st.title("Music Therapy: Explore The Data")
+
+    #pull the cleaned datasets from the shared pipeline instead of repeating the filtering here
+    pipeline = default_pipeline()
+    cleaned_data = pipeline.get("cleaned_data", copy=False)
+    
+    st.subheader("Any correlations between frequency and mental health?")
+
+    #every frequency column against the MH scores; the matrices are worked out once per version of
+    #the cleaned data (pearson, or rank-based spearman/kendall for these ordinal answers)
+    correlations = pipeline.get("cleaned_correlations")
+    method = st.selectbox("Choose a correlation method:", ["pearson", "spearman", "kendall"])
+    selected_features = FREQUENCY_COLUMNS + MH_COLUMNS # Focus on these variables
+
+    # Correlation Heatmap (Interactive)
+    correlation_matrix = correlations.matrix(method, selected_features).values
+    #only the correlations that are significant (p < 0.05) get a label
+    significant = correlations.significant(method, selected_features)
+    def build():
+        fig_heatmap = heatmaps.annotated_heatmap(
+             z=correlation_matrix,
+             x=selected_features,
+             y=selected_features,
+             colorscale='Viridis',
+             show=significant
+         )
+        fig_heatmap.update_layout(
+            title=f"{method.title()} Correlation Heatmap (Interactive)",
+            xaxis_title="Features",
+            yaxis_title="Features"
+        )
+        return fig_heatmap
+    figures.plotly_chart(build)
+    
+
+    #hours and mh
+    st.subheader("Is hours spent listening per day correlated with reported MH scores? Not strongly.")
+    selected_features = ['Hours per day', "Anxiety", "Depression", "Insomnia", "OCD"] # Focus on these variables
+
+    # Correlation Heatmap (Interactive)
+    correlation_matrix = correlations.matrix(method, selected_features).values
+    #only the correlations that are significant (p < 0.05) get a label
+    significant = correlations.significant(method, selected_features)
+    def build():
+        fig_heatmap = heatmaps.annotated_heatmap(
+             z=correlation_matrix,
+             x=selected_features,
+             y=selected_features,
+             colorscale='Viridis',
+             show=significant
+         )
+        fig_heatmap.update_layout(
+            title=f"{method.title()} Correlation Heatmap (Interactive)",
+            xaxis_title="Features",
+            yaxis_title="Features"
+        )
+        return fig_heatmap
+    figures.plotly_chart(build)
+    
+
+    st.subheader("How does mental health vary across age?")
+
+    bins = [18, 25, 31, 36, 41, 46, 51, 58, 64]  
+    labels = ['18-24', '25-30', '31-35', '36-40', '41-45', '46-50', '51-57', '58-64']  # Labels for the bins
+
+    #now plot it (density curves and box stats are computed here, and only a sample of the points is sent)
+    #the binned column is made inside build(), so the chart is keyed on the cleaned_data stage and the
+    #bins rather than on a new frame every rerun, and the binning only runs when the chart is drawn
+    def build():
+        # Create the binned column (next to the scores it's plotted against: cleaned_data is shared, not a copy)
+        age_anxiety = pd.DataFrame({'age_binned': pd.cut(cleaned_data['Age'], bins=bins, labels=labels, right=False),
+                                    'Anxiety': cleaned_data['Anxiety']})
+        fig_violin = violins.violin(age_anxiety, x='age_binned', y='Anxiety',
+                                    labels={'Age':'Age', 'Anxiety':'Anxiety'},
+                                    title="Interactive Violin Plot of Age vs Anxiety")
+        return fig_violin
+    figures.plotly_chart(build)
+
+    #fav genre and MH
+    st.subheader("Is fav genre associated with MH scores?")
+    def build():
+        fig_violin = violins.violin(cleaned_data, x='Fav genre', y='Anxiety',
+                                    labels={'Fav genre':'Favorite Genre', 'Anxiety':'Anxiety'},
+                                    title="Interactive Violin Plot of Fav Genre vs Anxiety")
+        return fig_violin
+    figures.plotly_chart(build)
+
+    def build():
+        fig_violin = violins.violin(cleaned_data, x='Fav genre', y='Depression',
+                                    labels={'Fav genre':'Favorite Genre', 'Depression':'Depression'},
+                                    title="Interactive Violin Plot of Fav Genre vs Depression ")
+        return fig_violin
+    figures.plotly_chart(build)
+
+    def build():
+        fig_violin = violins.violin(cleaned_data, x='Fav genre', y='OCD',
+                                    labels={'Fav genre':'Favorite Genre', 'OCD':'OCD'},
+                                    title="Interactive Violin Plot of Fav Genre vs OCD")
+        return fig_violin
+    figures.plotly_chart(build)
+
+    def build():
+        fig_violin = violins.violin(cleaned_data, x='Fav genre', y='Insomnia',
+                                    labels={'Fav genre':'Favorite Genre', 'Insomnia':'Insomnia'},
+                                    title="Interactive Violin Plot of Fav Genre vs Insomnia")
+        return fig_violin
+    figures.plotly_chart(build)
+
+    
+    #look at mental health stat by genre
+    st.subheader("Anxiety Score by Genre")
+    #sns.boxplot(data=cleaned_data, x="Frequency [Latin]", y = "Anxiety")
+    #plt.title('Anxiety Scores of Latin Listeners')
+
+    #box plot statistics for every genre, frequency level and MH score, worked out once per version
+    #of the cleaned data, so picking a genre or score just looks its boxes up
+    box_cube = pipeline.get("cleaned_box_cube")
+
+    #function to create and display a box plot for a specific genre
+    def plot_boxplot(genre, score):
+        stats = box_stats(box_cube, genre[len("Frequency ["):-1], score)
+        def draw():
+            fig, ax = plt.subplots(figsize=(10, 6))
+            ax.bxp(stats, patch_artist=True, boxprops=dict(facecolor="#3274a1"),
+                   medianprops=dict(color="black"), flierprops=dict(marker="d", markerfacecolor="0.3", markersize=5))
+            #make it so user can choose MH stat and genre
+            ax.set_title(f'{score} Scores of {genre} Listeners')
+            ax.set_xlabel(genre)
+            ax.set_ylabel(score)
+            return fig
+        figures.pyplot(draw)
+
+
+    #dropdown menu for selecting a mental health score
+    score_options = ["Anxiety", "Depression"]
+    selected_score = st.selectbox("Choose a mental health category to consider:", score_options)
+    
+    #dropdown menu for selecting a genre (every genre the survey asked about)
+    genre_options = FREQUENCY_COLUMNS
+    
+    selected_genre = st.selectbox("Choose a genre to consider:", genre_options)
+    
+
+    #call the plot function with the selected genre and score
+    plot_boxplot(selected_genre, selected_score)
+
+    #feature engineering
+    st.subheader("Feature Engineering:")
+    st.markdown("Create a dataset with final mental health scores based on frequency of genre consumption")
+
+    #group average MH scores by highest frequency genre
+    st.markdown("Group average MH scores by all Very Frequent genre responses")
+
+    #one pass over all 16 frequency columns gives every genre's average at every frequency,
+    #and mh_by_genre is the Very frequently slice of it
+    mh_by_genre = pipeline.get("cleaned_mh_by_genre")
+    
+    st.write(mh_by_genre)  
+
+
+    st.subheader("Heatmap of Genre and Average Mental Health Stat (based only on Very Frequent responses)")
+    def build():
+        fig = px.imshow(mh_by_genre.T, labels=dict(x="MH Score", y="Genre", color="Score"), color_continuous_scale="Viridis", 
+        title="Interactive Heatmap of Mental Health Scores by Genre",)
+        # Show the heatmap
+        return fig
+    figures.plotly_chart(build)
+
+
+    st.markdown("I used mh_by_genre.describe() to identify the MH category with the highest variability (SD) so I could capture more unique responses. This came out to be Depression (sd = 0.517690; Anxiety SD = 0.502129, Insomnia SD = 0.328233, OCD SD = 0.240497)")
+    st.markdown("I then created a binary feature that expressed whether the average depression score for a given genre was above or below 5. This is how I will recommend genres to users.")
+
+    mh_by_genre = add_effect(mh_by_genre)
+
+    st.write(mh_by_genre)
+
+
+    #This dataframe will be used to connect this analysis with the second dataset.
+    effect_df = mh_by_genre.reset_index(names='Genre')
+    st.write(effect_df.drop(["Anxiety", "Depression", "OCD", "Insomnia"], axis=1))
+
+
+    st.markdown("This is where I join the two datasets by their mutual column (genre), to result in a merged dataset with song titles, artist, valence, energy, danceability, duration, average anxiety score, average depression score, average, average OCD score, average insomnia score, and effect (whether depression is above 5 or below 5.")
@@ -0,0 +1,268 @@
+#Investigate The Data: distributions, missing values and correlations of the raw data
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import figures
+import histograms
+import missingness
+from pipeline import default_pipeline
+
+
+def render():
+    st.title("Music Therapy: Investigate The Data")
+
+    #load the Data
+    mxmh_survey_results = default_pipeline().get("survey", copy=False)
+    
+    #missing vals
+    st.subheader("Any missing vals?")
+    #make a heatmap of the missing data
+    #(drawn from per-column null counts and a fixed number of row bins, so it's the same size at any row count)
+    missing = default_pipeline().get("survey_missing", copy=False)
+    
+    def draw():
+        missingness.plot(missing, 'Visualizing Missing Values in mxmh_survey_results Dataset', 'mxmh_survey_results Index')
+    figures.pyplot(draw)
+    #which columns are missing values, and how many
+    missing_table = missing.table()
+    st.write(missing_table[missing_table["missing"] > 0])
+
+    #plans for missing vals
+    st.markdown("Plans To Handle Missing Data")
+    st.write("* Age will not be included in main analysis (listening habits and mental health), so outliers will be handled, but missing age values will not be.")
+    st.write("* Missing BPM vals will be replaced by the median of the genre each missing BMP belongs to. Please choose the Clean The Data tab to see how this is done.")
+    st. write("* As for Primary Streaming Serive, While Working, Music Effects, Instrumentalist, and Foreign Language, these missing vals will not be handled because they don't impact the main analysis. The purpose of this is to retain the important info of those observations (mental health scores and listening frequencies).")
+
+    #distribution 
+    st.header("Distribution of Features")
+    
+    st.subheader("Age")
+    #age 
+    def build():
+        fig = histograms.histogram(mxmh_survey_results, x="Age", title="Age Distribution")
+        return fig
+    figures.plotly_chart(build)
+    st.markdown("Most participants are between late teens and late 20s.")
+    
+    st.subheader("Streaming Service")
+    #streaming service
+    platforms = ['Spotify', 'Pandora', 'YouTube Music', 
+                 'I do not use a streaming service.', 
+                 'Apple Music', 'Other streaming service']
+    popularity = [458, 11, 94, 71, 51, 0]
+    
+    
+    #create a horizontal bar plot
+    def draw():
+        plt.figure(figsize=(10, 6))  # Set the figure size
+        plt.barh(platforms, popularity, color='skyblue')
+        plt.title('Distribution of Primary Streaming Service')
+        plt.xlabel('Popularity')
+        plt.ylabel('Streaming Service')
+    figures.pyplot(draw)
+    st.markdown("Most participants stream music with Spotify.")
+    
+    st.subheader("Favorite Genre")
+    #fav genre
+    def draw():
+        plt.figure(figsize=(10, 6))  
+        plt.hist(mxmh_survey_results["Fav genre"], bins=16, edgecolor='black')
+    
+        #set the title of the plot
+        plt.title('Distribution of Fav Genre', fontsize=16)
+    
+        #set the x-axis title
+        plt.xlabel('Fav Genre', fontsize=12)
+        plt.xticks(rotation=45) 
+    figures.pyplot(draw)
+
+    st.markdown("Most participants are fans of rock.")
+    
+    st.subheader("Mental Health Stats")
+
+    #create the histogram
+    def build():
+        #make a subset so we're only focused on the frequency columns
+        mh_subset = mxmh_survey_results[["Anxiety", "Depression", "OCD", "Insomnia"]]
+
+        #convert the dataset from wide to long format
+        long_format_df = mh_subset.melt(var_name='Score', value_name='Frequency')
+
+        fig = histograms.histogram(
+            long_format_df, 
+            x='Score', 
+            color='Frequency', 
+            barmode='group', 
+            title='Frequency Distribution of Mental Health Scores'
+        )
+
+        #trying to get rid of the gridlines to follow Tufte's rules
+        #remove x-axis gridlines
+        fig.update_layout(plot_bgcolor='white')
+    
+        #show the plot 
+        return fig
+    figures.plotly_chart(build)
+
+    st.markdown("Most participants experience anxiety and depression but not OCD or insomnia as much.")
+    
+    #frequency
+    # st.subheader("Genre Frequency")
+
+    # #make a subset so we're only focused on the frequency columns
+    # frequency_subset = mxmh_survey_results[['Frequency [Classical]',
+    #        'Frequency [Country]', 'Frequency [EDM]', 'Frequency [Folk]',
+    #        'Frequency [Gospel]', 'Frequency [Hip hop]', 'Frequency [Jazz]',
+    #        'Frequency [K pop]', 'Frequency [Latin]', 'Frequency [Lofi]',
+    #        'Frequency [Metal]', 'Frequency [Pop]', 'Frequency [R&B]',
+    #        'Frequency [Rap]', 'Frequency [Rock]', 'Frequency [Video game music]']]
+    
+    
+    # #rename the columns to keep only genre names using str.replace()
+    # frequency_subset.columns = frequency_subset.columns.str.replace(r'Frequency \[(.*)\]', r'\1', regex=True)
+    
+    # #convert the dataset from wide to long format
+    # ##the melt function reshapes the dataframe so that all genre frequencies are in a single column, with an additional column indicating the genre.
+    # long_format_df = frequency_subset.melt(var_name='Genre', value_name='Frequency')
+
+    # #order 'Frequency' column chronologically 
+    # order = ['Never', 'Rarely', 'Sometimes', 'Very Frequently']
+    # long_format_df['Genre'] = pd.Categorical(long_format_df['Genre'], categories=order, ordered=True)
+
+    
+    # #create the histogram
+    # fig = px.histogram(long_format_df, 
+    #                    x='Genre',  ######### x = frequency and color = genre will give you 4 sets of 16 bars
+    #                    color='Frequency',  ###########
+    #                   #this will give me 16 sets of 4 bars instead of 4 overlaid sets of bars
+    #                    barmode='group', 
+    #                    category_orders={
+    #                        'Frequency': ['Never', 'Rarely', 'Sometimes', 'Very Frequently']  # Custom order
+    #                    },
+    #                    title='Frequency Distribution of Music Genres')
+    
+    # #remove x-axis gridlines
+    # fig.update_layout(xaxis=dict(showgrid=False))
+    
+    # #show the plot 
+    # st.plotly_chart(fig)
+    
+    
+    #Experts
+    st.subheader("Experts")
+    
+    def draw():
+        fig, ax = plt.subplots()
+        sns.histplot(data=mxmh_survey_results, x="Composer", bins=2, label="Composers", multiple="stack", ax=ax)
+        sns.histplot(data=mxmh_survey_results, x="Instrumentalist", bins=2, label="Instrumentalists", ax=ax)
+    
+        ax.legend()
+    
+        ax.set_title("Distribution of Composers and Instrumentalists")
+    figures.pyplot(draw)
+
+    st.markdown("Most of the participants are not instrumentalists nor composers.")
+    
+    #Music Effects
+    st.subheader("Music Effects")
+    def draw():
+        fig, ax = plt.subplots()
+        sns.histplot(data=mxmh_survey_results, x='Music effects', hue='Music effects', palette=['red', 'blue', 'green'])
+        ax.legend()
+        ax.set_title("Distribution of Perceived Music Effects")
+    figures.pyplot(draw)
+
+    st.markdown("Most of the participants say music does have a positive effect on their mental health.")
+    
+    st.subheader("Hours Per Day")
+    def draw():
+        fig, ax = plt.subplots()
+        sns.histplot(data=mxmh_survey_results, x='Hours per day')
+        ax.legend()
+        ax.set_title("Hours Per Day")
+    figures.pyplot(draw)
+
+    #look at outliers
+    st.subheader("Any Outliers?")
+    
+    #hour outliers
+    num_24_hours = sum(mxmh_survey_results['Hours per day'] == 24)
+    st.write(f"Number of participants reporting 24 hours per day: {num_24_hours}")
+    
+    #age outliers:
+    age_outliers = sum((mxmh_survey_results['Age'] > 70) | (mxmh_survey_results['Age'] < 18))
+    st.write(f"Number of participants younger than 18 or older than 70: {age_outliers}")
+
+
+    st.subheader("Investigate Second Dataset")
+
+    #load the Data
+    songs = default_pipeline().get("songs", copy=False)
+    
+    st.markdown("No Missing Vals")
+
+    #make a heatmap of the missing data
+    
+    #(drawn from per-column null counts and a fixed number of row bins, so it's the same size at any row count)
+    missing = default_pipeline().get("songs_missing", copy=False)
+    
+    def draw():
+        missingness.plot(missing, 'Visualizing Missing Values in Songs Dataset', 'Songs Index')
+    figures.pyplot(draw)
+
+    #investigating columns 
+
+    st.markdown("Distribution of features")
+    st.write("The features are imbalanced. Most songs have a mid-high valence, high energy, mid-high danceability, and duration of 200 seconds.")
+    
+    # Create the plot
+    def draw():
+        fig, ax = plt.subplots(figsize=(8, 6))  # Set figure size
+        sns.histplot(data=songs, x='valence', ax=ax)
+    
+        # Set title and labels
+        ax.set_title('Distribution of Valence')
+        ax.set_xlabel('Valence')
+        ax.set_ylabel('Count')
+    # Display the plot in Streamlit
+    figures.pyplot(draw)
+
+    
+    
+    # Create the plot
+    def draw():
+        fig, ax = plt.subplots(figsize=(10, 6))  # Set figure size
+        sns.histplot(data=songs, x='energy', ax=ax)
+    
+        # Set title and labels
+        ax.set_title('Distribution of Energy')
+        ax.set_xlabel('Energy')
+        ax.set_ylabel('Count')
+    # Display the plot in Streamlit
+    figures.pyplot(draw)
+    
+
+    # Create the plot
+    def draw():
+        fig, ax = plt.subplots(figsize=(10, 6))  # Set figure size
+        sns.histplot(data=songs, x='danceability', ax=ax)
+    
+        # Set title and labels
+        ax.set_title('Distribution of Danceability')
+        ax.set_xlabel('Danceability')
+        ax.set_ylabel('Count')
+    # Display the plot in Streamlit
+    figures.pyplot(draw)
+
+    # Create the plot
+    def draw():
+        fig, ax = plt.subplots(figsize=(10, 6))  # Set figure size
+        sns.histplot(data=songs, x='duration_ms', ax=ax)
+    
+        # Set title and labels
+        ax.set_title('Distribution of Duration')
+        ax.set_xlabel('Duration')
+        ax.set_ylabel('Count')
+    # Display the plot in Streamlit
+    figures.pyplot(draw)
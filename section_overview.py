@@ -0,0 +1,47 @@
+#Data Overview: what the two datasets look like
+import streamlit as st
+
+from pipeline import default_pipeline
+
+
+def render():
+    #title of the app
+    st.title("Welcome To My Music Therapy App")
+    st.markdown("Please be advised that all recommendations are based on self-reported mental health scores of listeners. Since these recommendations are based on the correlations between listening preferences and mental health, they are not proven to *cause* changes in mood, but rather are *associated* with changes in mood.")
+
+    
+    #display the selected category
+    #st.write(f"You selected: {selected_category}")
+    
+    #markdown section
+    st.subheader("What does the first [dataset](https://www.kaggle.com/datasets/catherinerasgaitis/mxmh-survey-results) look like?")
+    st.markdown("* Purpose: this dataset will build our recommendation system by providing info on the relationships between listening habits and mental health")
+    st.markdown("* Mixture of data types (ex: Primary streaming service: Nominal, Hours per day: Ratio, Anxiety: Ordinal, Composer: Binary")
+    st.markdown("Feature description:")
+    st.write("* All observations are self-reported")
+    st.write("* 16 unique genres are considered")
+    st.write("* BMP = Beats per minute of favorite genre")
+    st.write("* All feature descriptions are on the link above")
+    
+    #load the Data
+    mxmh_survey_results = default_pipeline().get("survey", copy=False)
+        
+    #display the data
+    st.write(mxmh_survey_results.head())  
+
+    #markdown section
+    st.subheader("What does the second [dataset](https://www.kaggle.com/datasets/paradisejoy/top-hits-spotify-from-20002019) look like?")
+    st.markdown("* Purpose: this dataset will provide a libary to pull songs from based on user input. Since it also includes a genre column, the two datasets will be joined on genre.")
+    st.markdown("* Mixture of data types (ex: Artist: Nominal, Duration_ms: Ratio, Popularity: Ordinal, Explicit: Binary)")
+    st.markdown("Feature description:")
+    st.write("* Valence: positivity of the track (0 to 1)")
+    st.write("* Danceability: considers tempo, beat strength, and rhythm stability")
+    st.write("* Energy: intensity of song (0 to 1)")
+    st.write("* All feature descriptions are on the link above")
+
+    
+    #load the Data
+    songs = default_pipeline().get("songs", copy=False)
+        
+    #display the data
+    st.write(songs.head())  
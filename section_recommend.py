@@ -0,0 +1,142 @@
+#Get Recommendations: genres and songs for a listening goal
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import figures
+import sections
+from aggregates import add_effect
+from pipeline import default_pipeline
+from recommender import SONG_COLUMNS
+
+
+def render():
+    st.title("Music Therapy: Get Recommendations")
+
+
+    #the genre averages here are based on the data before the genre and MH rebalancing
+    pipeline = default_pipeline()
+    mh_by_genre = add_effect(pipeline.get("mh_by_genre"))
+
+    #the join with the songs, indexed by genre and effect and sorted by popularity
+    song_index = pipeline.get("song_index")
+
+    #nearest neighbors over the songs' audio features, for "more like this"
+    similarity_index = pipeline.get("similarity_index")
+
+    #only this part reruns when the listening goal or the liked song changes
+    listening_goal(mh_by_genre, song_index, similarity_index)
+
+
+@st.fragment
+def listening_goal(mh_by_genre, song_index, similarity_index):
+    with sections.timed("Get Recommendations: listening goal"):
+        mood_increase_genres = mh_by_genre[mh_by_genre["Effect"] == 0]
+        mood_decrease_genres = mh_by_genre[mh_by_genre["Effect"] == 1]
+
+        increase_recommendations = mood_increase_genres.index
+        decrease_recommendations = mood_decrease_genres.index
+
+        st.markdown("Please choose a listening goal to recieve aligned genre recommendations.")
+        #dropdown menu
+        categories = ["Mood Increase", "Mood Decrease"]
+        selected_category = st.selectbox("Choose a listening goal:", categories)
+
+        if selected_category == "Mood Increase":
+    
+            #display the selected category
+            st.write(f"You selected: {selected_category}")
+
+            st.markdown("Here are your recommended genres:")
+            st.write(increase_recommendations)
+
+            st.markdown("Here are the most popular songs from those genres:")
+            st.write(song_index.recommend(selected_category, k=10)[SONG_COLUMNS])
+
+            #include a visualization
+            # Create a figure and axis
+            def draw():
+                #set the plot style for this chart only (sns.set would restyle every chart drawn after it)
+                with sns.axes_style("whitegrid"), sns.plotting_context("notebook"):
+                    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+            
+                    # Create a bar plot for each mental health measure
+                    sns.barplot(x=mh_by_genre.index, y='Anxiety', data=mh_by_genre, ax=axes[0, 0], palette='viridis')
+                    axes[0, 0].set_title('Anxiety Levels by Genre')
+                    axes[0, 0].set_ylabel('Anxiety Level')
+                    axes[0, 0].tick_params(axis='x', rotation=45)
+            
+                    sns.barplot(x=mh_by_genre.index, y='Depression', data=mh_by_genre, ax=axes[0, 1], palette='viridis')
+                    axes[0, 1].set_title('Depression Levels by Genre')
+                    axes[0, 1].set_ylabel('Depression Level')
+                    axes[0, 1].tick_params(axis='x', rotation=45)
+            
+                    sns.barplot(x=mh_by_genre.index, y='Insomnia', data=mh_by_genre, ax=axes[1, 0], palette='viridis')
+                    axes[1, 0].set_title('Insomnia Levels by Genre')
+                    axes[1, 0].set_ylabel('Insomnia Level')
+                    axes[1, 0].tick_params(axis='x', rotation=45)
+            
+                    sns.barplot(x=mh_by_genre.index, y='OCD', data=mh_by_genre, ax=axes[1, 1], palette='viridis')
+                    axes[1, 1].set_title('OCD Levels by Genre')
+                    axes[1, 1].set_ylabel('OCD Level')
+                    axes[1, 1].tick_params(axis='x', rotation=45)
+
+                    plt.tight_layout()
+            #show the plot
+            figures.pyplot(draw)
+
+
+        if selected_category == "Mood Decrease":
+    
+            #display the selected category
+            st.write(f"You selected: {selected_category}")
+
+            st.markdown("Here are your recommended genres:")
+            st.write(decrease_recommendations)
+
+            st.markdown("Here are the most popular songs from those genres:")
+            st.write(song_index.recommend(selected_category, k=10)[SONG_COLUMNS])
+
+            #include a visualization
+            # Create a figure and axis
+            def draw():
+                #set the plot style for this chart only (sns.set would restyle every chart drawn after it)
+                with sns.axes_style("whitegrid"), sns.plotting_context("notebook"):
+                    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+            
+                    # Create a bar plot for each mental health measure
+                    sns.barplot(x=mh_by_genre.index, y='Anxiety', data=mh_by_genre, ax=axes[0, 0], palette='viridis')
+                    axes[0, 0].set_title('Anxiety Levels by Genre')
+                    axes[0, 0].set_ylabel('Anxiety Level')
+                    axes[0, 0].tick_params(axis='x', rotation=45)
+            
+                    sns.barplot(x=mh_by_genre.index, y='Depression', data=mh_by_genre, ax=axes[0, 1], palette='viridis')
+                    axes[0, 1].set_title('Depression Levels by Genre')
+                    axes[0, 1].set_ylabel('Depression Level')
+                    axes[0, 1].tick_params(axis='x', rotation=45)
+            
+                    sns.barplot(x=mh_by_genre.index, y='Insomnia', data=mh_by_genre, ax=axes[1, 0], palette='viridis')
+                    axes[1, 0].set_title('Insomnia Levels by Genre')
+                    axes[1, 0].set_ylabel('Insomnia Level')
+                    axes[1, 0].tick_params(axis='x', rotation=45)
+            
+                    sns.barplot(x=mh_by_genre.index, y='OCD', data=mh_by_genre, ax=axes[1, 1], palette='viridis')
+                    axes[1, 1].set_title('OCD Levels by Genre')
+                    axes[1, 1].set_ylabel('OCD Level')
+                    axes[1, 1].tick_params(axis='x', rotation=45)
+
+                    plt.tight_layout()
+            #show the plot
+            figures.pyplot(draw)
+    
+        
+
+        #more like this
+        st.markdown("Like one of these songs? Pick it to find more songs that sound like it from your recommended genres:")
+        recommended = song_index.recommend(selected_category, k=10)
+        liked_song = st.selectbox("Choose a song:", list(zip(recommended["artist"], recommended["song"])),
+                                  format_func=lambda artist_song: f"{artist_song[1]} - {artist_song[0]}")
+        if liked_song is not None:
+            similar_songs = similarity_index.similar(similarity_index.song_id(*liked_song), k=10,
+                                                     genres=song_index.genres(selected_category))
+            st.write(similar_songs[["artist", "song", "year", "popularity"]])
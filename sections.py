@@ -0,0 +1,54 @@
+#the app's sections, each in its own module with a render() function
+#a section's module (and the plotting libraries it imports) is only loaded the first time it's
+#shown, and only the selected section runs on a rerun. Every render is timed per section, so
+#per-interaction latency can be looked at page by page (see summary() and benchmarks.py)
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import pandas as pd
+
+import lazy
+
+#section name -> module, in the order the dropdown lists them
+SECTIONS = {
+    "Data Overview": "section_overview",
+    "Investigate The Data": "section_investigate",
+    "Clean The Data": "section_clean",
+    "Explore The Data": "section_explore",
+    "Get Recommendations": "section_recommend",
+}
+
+#how many of the latest render times to keep per section
+HISTORY = 100
+
+#section (or fragment) name -> its latest render times in seconds
+timings = {}
+_lock = threading.Lock()
+
+
+@contextmanager
+def timed(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            timings.setdefault(name, deque(maxlen=HISTORY)).append(elapsed)
+
+
+def render(name):
+    module = lazy.load(SECTIONS[name])
+    with timed(name):
+        module.render()
+
+
+def summary():
+    #renders, latest and median time (ms) of every section that has been shown
+    with _lock:
+        rows = {name: list(times) for name, times in timings.items()}
+    return pd.DataFrame(
+        [(name, len(times), times[-1] * 1000, pd.Series(times).median() * 1000) for name, times in rows.items()],
+        columns=["section", "renders", "latest_ms", "median_ms"]).set_index("section")
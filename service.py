@@ -0,0 +1,298 @@
+#Get Recommendations as a standalone JSON service, without Streamlit
+#the genre averages, the song index and the similarity index are loaded once at startup (from the
+#pipeline's snapshots when they exist), and every response after that is a lookup into them;
+#responses are kept serialized, so a repeated request is a dictionary lookup plus a socket write
+#
+#   python service.py                       serve on 127.0.0.1:8000 with the small asyncio server below
+#   python service.py --server uvicorn      the same app under uvicorn (optional, not a requirement)
+#   uvicorn service:app                     it's a plain ASGI app
+#   python loadtest.py --spawn              start it and measure throughput and latency
+#
+#endpoints (all GET, all JSON):
+#   /health
+#   /goals
+#   /genres?goal=Mood Increase                          the genres that serve a listening goal
+#   /songs?goal=Mood Increase&k=10                      the most popular songs from those genres
+#   /genres/Rock/songs?k=10                             the most popular songs from one genre
+#   /similar?artist=...&song=...&goal=...&k=10          songs that sound like one (within the goal's genres)
+import argparse
+import asyncio
+import json
+from collections import OrderedDict
+from urllib.parse import parse_qsl, unquote
+
+from aggregates import add_effect
+from data_loader import MH_COLUMNS
+from pipeline import default_pipeline
+from recommender import GOALS, SONG_COLUMNS
+
+HOST = "127.0.0.1"
+PORT = 8000
+#default and largest number of songs a request can ask for
+DEFAULT_K = 10
+MAX_K = 100
+#serialized responses kept for repeated requests (least recently used dropped first)
+CACHE_SIZE = 4096
+
+
+class HTTPError(Exception):
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _records(frame, columns):
+    #rows as plain dicts of plain Python values, ready for json
+    return json.loads(frame[columns].to_json(orient="records"))
+
+
+class RecommendationService:
+    #an ASGI app; call load() first, or let the lifespan startup (or the first request) do it
+
+    def __init__(self, pipeline=None, cache_size=CACHE_SIZE):
+        self.pipeline = pipeline
+        self.cache_size = cache_size
+        self.loaded = False
+        #(path, query) -> (status, body)
+        self._responses = OrderedDict()
+
+    def load(self):
+        pipeline = self.pipeline or default_pipeline()
+        mh_by_genre = add_effect(pipeline.get("mh_by_genre"))
+        self.song_index = pipeline.get("song_index")
+        self.similarity_index = pipeline.get("similarity_index")
+
+        #everything that doesn't depend on k is worked out here, once
+        self.genres = {
+            goal: [{"genre": genre, **{column: round(float(row[column]), 4) for column in MH_COLUMNS}}
+                   for genre, row in mh_by_genre[mh_by_genre["Effect"] == effect].iterrows()]
+            for goal, effect in GOALS.items()}
+        self.songs = {goal: _records(self.song_index.recommend(goal, k=MAX_K), SONG_COLUMNS) for goal in GOALS}
+        self.genre_songs = {genre: _records(self.song_index.recommend_genre(genre, k=MAX_K), SONG_COLUMNS)
+                            for genre in self.song_index.effects}
+        self.loaded = True
+        return self
+
+    #endpoints: each takes the query parameters and returns what to send as JSON
+
+    def health(self, query):
+        return {"status": "ok", "songs": len(self.song_index.songs), "genres": len(self.song_index.effects)}
+
+    def list_goals(self, query):
+        return {"goals": list(GOALS)}
+
+    def goal_genres(self, query):
+        goal = _goal(query)
+        return {"goal": goal, "genres": self.genres[goal]}
+
+    def goal_songs(self, query):
+        goal, k = _goal(query), _k(query)
+        return {"goal": goal, "songs": self.songs[goal][:k]}
+
+    def genre_songs_for(self, genre, query):
+        if genre not in self.genre_songs:
+            raise HTTPError(404, f"Unknown genre: {genre}")
+        return {"genre": genre, "songs": self.genre_songs[genre][:_k(query)]}
+
+    def similar_songs(self, query):
+        artist, song = query.get("artist"), query.get("song")
+        if not artist or not song:
+            raise HTTPError(400, "artist and song are required")
+        try:
+            song_id = self.similarity_index.song_id(artist, song)
+        except KeyError:
+            raise HTTPError(404, f"Unknown song: {song} - {artist}")
+        genres = self.song_index.genres(_goal(query)) if "goal" in query else None
+        similar = self.similarity_index.similar(song_id, k=_k(query), genres=genres)
+        return {"artist": artist, "song": song, "goal": query.get("goal"),
+                "songs": _records(similar, ["artist", "song", "year", "popularity", "distance"])}
+
+    ROUTES = {
+        "/health": health,
+        "/goals": list_goals,
+        "/genres": goal_genres,
+        "/songs": goal_songs,
+        "/similar": similar_songs,
+    }
+
+    def respond(self, method, path, query_string):
+        #(status, JSON body) for a request, from the cache when it's been asked before
+        if method not in ("GET", "HEAD"):
+            return 405, json.dumps({"error": f"Method not allowed: {method}"}, separators=(",", ":")).encode()
+        key = (path, query_string)
+        cached = self._responses.get(key)
+        if cached is not None:
+            self._responses.move_to_end(key)
+            return cached
+        if not self.loaded:
+            self.load()
+
+        try:
+            query = dict(parse_qsl(query_string.decode("latin-1")))
+            parts = path.strip("/").split("/")
+            if len(parts) == 3 and parts[0] == "genres" and parts[2] == "songs":
+                payload = self.genre_songs_for(parts[1], query)
+            elif path in self.ROUTES:
+                payload = self.ROUTES[path](self, query)
+            else:
+                raise HTTPError(404, f"Not found: {path}")
+            status = 200
+        except HTTPError as error:
+            status, payload = error.status, {"error": error.message}
+        response = (status, json.dumps(payload, separators=(",", ":")).encode())
+
+        #only answers that can't change are kept (every 200, and 404s for unknown names)
+        if status in (200, 404):
+            self._responses[key] = response
+            if len(self._responses) > self.cache_size:
+                self._responses.popitem(last=False)
+        return response
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    self.load()
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+        status, body = self.respond(scope["method"], scope["path"], scope.get("query_string", b""))
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+
+def _goal(query):
+    goal = query.get("goal")
+    if goal not in GOALS:
+        raise HTTPError(400, f"goal must be one of: {', '.join(GOALS)}")
+    return goal
+
+
+def _k(query):
+    try:
+        k = int(query.get("k", DEFAULT_K))
+    except ValueError:
+        raise HTTPError(400, "k must be a whole number")
+    if not 1 <= k <= MAX_K:
+        raise HTTPError(400, f"k must be between 1 and {MAX_K}")
+    return k
+
+
+app = RecommendationService()
+
+
+#a minimal HTTP/1.1 front end for ASGI apps (keep-alive, GET/HEAD, no request bodies),
+#for running without uvicorn; it's enough for the endpoints above and for loadtest.py
+
+_REASONS = {200: b"OK", 400: b"Bad Request", 404: b"Not Found", 405: b"Method Not Allowed",
+            500: b"Internal Server Error"}
+
+
+async def _handle_connection(asgi_app, reader, writer):
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                return
+            try:
+                lines = head.decode("latin-1").split("\r\n")
+                request_line = lines[0].split(" ", 2)
+                if len(request_line) != 3 or not request_line[2].startswith("HTTP/"):
+                    raise ValueError(f"malformed request line {lines[0]!r}")
+                method, target, version = request_line
+                headers = [tuple(line.split(":", 1)) for line in lines[1:] if ":" in line]
+                headers = [(name.strip().lower().encode(), value.strip().encode()) for name, value in headers]
+                fields = dict(headers)
+                length = int(fields.get(b"content-length", 0))
+                if length < 0:
+                    raise ValueError(f"negative content-length: {length}")
+            except ValueError as error:
+                #nothing after a request we can't read can be trusted to start where the next one does
+                body = json.dumps({"error": f"Bad request: {error}"}).encode()
+                writer.write(b"HTTP/1.1 400 Bad Request\r\ncontent-type: application/json\r\n"
+                             b"content-length: %d\r\nconnection: close\r\n\r\n" % len(body) + body)
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    pass
+                return
+            if length:
+                #the client can hang up before sending the body it announced
+                try:
+                    await reader.readexactly(length)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+            path, _, query_string = target.partition("?")
+            scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": version[5:], "method": method,
+                     "scheme": "http", "path": unquote(path), "raw_path": path.encode(),
+                     "query_string": query_string.encode(), "headers": headers}
+
+            response = []
+
+            async def receive():
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def send(message):
+                response.append(message)
+
+            try:
+                await asgi_app(scope, receive, send)
+            except Exception as error:
+                body = json.dumps({"error": f"{type(error).__name__}: {error}"}).encode()
+                response = [{"type": "http.response.start", "status": 500,
+                             "headers": [(b"content-type", b"application/json"),
+                                         (b"content-length", str(len(body)).encode())]},
+                            {"type": "http.response.body", "body": body}]
+            start, body = response[0], b"".join(message.get("body", b"") for message in response[1:])
+            status = start["status"]
+            keep_alive = fields.get(b"connection", b"").lower() != b"close" and version == "HTTP/1.1"
+            out = [b"HTTP/1.1 %d %s\r\n" % (status, _REASONS.get(status, b""))]
+            out += [name + b": " + value + b"\r\n" for name, value in start["headers"]]
+            out.append(b"connection: keep-alive\r\n\r\n" if keep_alive else b"connection: close\r\n\r\n")
+            writer.write(b"".join(out) + body)
+            try:
+                await writer.drain()
+            except ConnectionError:
+                return
+            if not keep_alive:
+                return
+    finally:
+        writer.close()
+
+
+async def serve_builtin(asgi_app, host=HOST, port=PORT):
+    if hasattr(asgi_app, "load"):
+        asgi_app.load()
+    server = await asyncio.start_server(lambda r, w: _handle_connection(asgi_app, r, w), host, port, backlog=1024)
+    print(f"Serving recommendations on http://{host}:{port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def serve(host=HOST, port=PORT, server="builtin"):
+    #the built-in server by default: for these small cached responses it's several times
+    #faster than uvicorn's pure-Python HTTP parser
+    if server == "uvicorn":
+        import uvicorn
+
+        uvicorn.run(app, host=host, port=port, log_level="warning", access_log=False)
+    else:
+        asyncio.run(serve_builtin(app, host, port))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve listening-goal recommendations as JSON.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--server", choices=["builtin", "uvicorn"], default="builtin",
+                        help="HTTP server to run the app with")
+    args = parser.parse_args()
+    serve(args.host, args.port, args.server)
@@ -0,0 +1,80 @@
+#"more like this": nearest neighbors over the songs' audio features
+import numpy as np
+
+from lazy import lazy
+
+#sklearn is only imported when an index is built (or unpickled)
+sklearn_neighbors = lazy("sklearn.neighbors")
+
+FEATURES = ["danceability", "energy", "valence", "tempo", "acousticness", "instrumentalness",
+            "speechiness", "loudness", "liveness"]
+
+
+class SimilarityIndex:
+    #KD-trees over the standardized audio features of every (non-explicit) song,
+    #one for the whole catalog and one per genre, built once and reused for every query
+
+    def __init__(self, songs_expanded, leaf_size=20):
+        #songs_expanded lists a song once per genre, the trees need each song once
+        keys = ["artist", "song"]
+        songs = songs_expanded.drop_duplicates(keys).reset_index(drop=True)
+        self.songs = songs.drop(columns=["genre"])
+
+        features = songs[FEATURES].to_numpy(dtype="float64")
+        self.mean = features.mean(axis=0)
+        self.std = features.std(axis=0)
+        self.std[self.std == 0] = 1
+        self.features = (features - self.mean) / self.std
+        self.tree = sklearn_neighbors.KDTree(self.features, leaf_size=leaf_size)
+
+        #song id (row in self.songs) for every (artist, song) and every genre
+        song_ids = _song_keys(songs, keys)
+        self.ids = {key: i for i, key in enumerate(song_ids)}
+        genre_ids = songs_expanded.assign(song_id=[self.ids[key] for key in _song_keys(songs_expanded, keys)])
+        self.genre_trees = {}
+        for genre, ids in genre_ids.groupby("genre", observed=True, sort=False)["song_id"]:
+            ids = np.unique(ids.to_numpy())
+            self.genre_trees[genre] = (ids, sklearn_neighbors.KDTree(self.features[ids], leaf_size=leaf_size))
+
+    def song_id(self, artist, song):
+        return self.ids[(artist, song)]
+
+    def neighbors(self, song_id, k=10, genres=None):
+        #ids and distances of the k songs closest to song_id, optionally only from the given genres
+        point = self.features[song_id:song_id + 1]
+
+        if genres is None:
+            searches = [(None, self.tree)]
+        else:
+            searches = [self.genre_trees[genre] for genre in genres if genre in self.genre_trees]
+
+        #ask every tree for one extra neighbor in case the song itself comes back
+        distances, ids = [], []
+        for tree_ids, tree in searches:
+            n = min(k + 1, tree.data.shape[0])
+            dist, idx = tree.query(point, k=n)
+            distances.append(dist[0])
+            ids.append(idx[0] if tree_ids is None else tree_ids[idx[0]])
+        if not ids:
+            return np.array([], dtype=int), np.array([])
+
+        distances = np.concatenate(distances)
+        ids = np.concatenate(ids)
+        order = np.argsort(distances, kind="stable")
+        ids, first = np.unique(ids[order], return_index=True)
+        #np.unique sorts by id, put them back in distance order
+        keep = np.argsort(first)
+        ids, distances = ids[keep], distances[order][first[keep]]
+
+        mask = ids != song_id
+        return ids[mask][:k], distances[mask][:k]
+
+    def similar(self, song_id, k=10, genres=None):
+        #the k closest songs as a table, with how far each one is from song_id
+        ids, distances = self.neighbors(song_id, k, genres)
+        return self.songs.iloc[ids].assign(distance=distances)
+
+
+def _song_keys(frame, keys):
+    #(artist, song) tuples for every row
+    return list(zip(*(frame[key] for key in keys)))
@@ -0,0 +1,158 @@
+#mergeable quantile sketches (KLL) for distributions too big to hold in memory
+#a sketch keeps about 3k values no matter how many it has seen, answers any quantile within a
+#small rank error, and sketches built over separate chunks, shards or worker processes can be
+#merged into the sketch of all the data. While a sketch has seen fewer values than it can hold,
+#its answers are exact (and match pandas' median/quantile).
+import zlib
+
+import numpy as np
+import pandas as pd
+
+#with k=200 a quantile is off by about 1% of the ranks at worst (usually much less)
+DEFAULT_K = 200
+
+
+class KLLSketch:
+
+    def __init__(self, k=DEFAULT_K, seed=0):
+        self.k = k
+        self.n = 0
+        #levels[h] holds values that each stand for 2**h of the original values
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return self.n
+
+    def _capacity(self, level):
+        #the top level holds k values, each level below it 2/3 as many
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        #add a batch of values (missing ones are skipped)
+        values = np.asarray(values, dtype="float64").ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self.n += len(values)
+            self._compress()
+        return self
+
+    def merge(self, other):
+        #fold another sketch into this one, level by level
+        for h, items in enumerate(other.levels):
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def _compress(self):
+        #while the sketch is over capacity, halve the lowest full level: sort it, keep every
+        #other value (starting at a random one of the first two) and move those up a level
+        while sum(len(items) for items in self.levels) > sum(self._capacity(h) for h in range(len(self.levels))):
+            for h, items in enumerate(self.levels):
+                if len(items) < self._capacity(h):
+                    continue
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                #an odd value out stays behind so the total weight doesn't change
+                leftover, items = items[:len(items) % 2], items[len(items) % 2:]
+                promoted = items[self._rng.integers(2)::2]
+                self.levels[h] = leftover
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+                break
+
+    def _sorted(self):
+        #every kept value in order, with the cumulative number of original values it covers
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** h, dtype="int64") for h, items in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        return values[order], np.cumsum(weights[order])
+
+    def quantile(self, q):
+        #the q-th quantile (q can be a list), interpolated between neighbouring ranks like pandas does
+        q = np.asarray(q, dtype="float64")
+        if self.n == 0:
+            return np.full(q.shape, np.nan)[()]
+        values, cumulative = self._sorted()
+        rank = q * (self.n - 1)
+        low = values[np.searchsorted(cumulative, np.floor(rank), side="right")]
+        high = values[np.searchsorted(cumulative, np.ceil(rank), side="right")]
+        return (low + (rank - np.floor(rank)) * (high - low))[()]
+
+    def median(self):
+        return self.quantile(0.5)
+
+    def rank(self, x):
+        #about how many of the values seen are <= x (x can be a list)
+        return self._count(x, "right")
+
+    def histogram(self, edges):
+        #about how many values fall in each [edges[i], edges[i + 1]) bin, for distribution charts
+        return np.diff(self._count(np.asarray(edges, dtype="float64"), "left"))
+
+    def _count(self, x, side):
+        #values seen that are < x (side="left") or <= x (side="right")
+        if self.n == 0:
+            return np.zeros(np.shape(x), dtype="int64")[()]
+        values, cumulative = self._sorted()
+        cumulative = np.concatenate([[0], cumulative])
+        return cumulative[np.searchsorted(values, x, side=side)][()]
+
+
+class GroupedSketch:
+    #one KLLSketch per group, e.g. the BPM distribution of every Fav genre
+
+    def __init__(self, k=DEFAULT_K, seed=0):
+        self.k = k
+        self.seed = seed
+        self.sketches = {}
+
+    def sketch(self, key):
+        if key not in self.sketches:
+            #every group gets its own seed, so results don't depend on the order groups show up in
+            self.sketches[key] = KLLSketch(self.k, [self.seed, zlib.crc32(repr(key).encode())])
+        return self.sketches[key]
+
+    def update(self, keys, values):
+        values = pd.Series(np.asarray(values, dtype="float64"))
+        for key, group in values.groupby(np.asarray(keys), sort=False):
+            self.sketch(key).update(group.to_numpy())
+        return self
+
+    def merge(self, other):
+        for key, sketch in other.sketches.items():
+            self.sketch(key).merge(sketch)
+        return self
+
+    def quantile(self, q):
+        #one value per group, sorted by group like a groupby would be
+        keys = sorted(key for key, sketch in self.sketches.items() if sketch.n)
+        return pd.Series([self.sketches[key].quantile(q) for key in keys], index=pd.Index(keys), dtype="float64")
+
+    def median(self):
+        return self.quantile(0.5)
+
+
+def merge_all(sketches):
+    #merge sketches built on separate chunks, shards or processes into one
+    sketches = iter(sketches)
+    merged = next(sketches)
+    for sketch in sketches:
+        merged.merge(sketch)
+    return merged
+
+
+def bpm_sketch(chunks, group="Fav genre", column="BPM", k=DEFAULT_K, seed=0):
+    #per-genre BPM distributions over a stream of survey frames, e.g.
+    #data_loader.iter_survey(path, ["Fav genre", "BPM"]); .median() is a fill table for
+    #cleaning.impute_bpm(chunk, medians=...)
+    sketch = GroupedSketch(k, seed)
+    for chunk in chunks:
+        known = chunk[group].notna()
+        sketch.update(chunk.loc[known, group].astype("object"), chunk.loc[known, column])
+    return sketch
@@ -0,0 +1,119 @@
+#versioned columnar (Parquet) snapshots of pipeline stages
+#once a snapshot exists for the current version of the source CSVs, the app reads it
+#straight from disk instead of parsing the CSVs and re-running the cleaning stages
+#stages that build lookup objects rather than frames (like the song similarity trees) are pickled
+import hashlib
+import os
+import pickle
+import threading
+
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  #snapshots are an optimization, the app still works without pyarrow
+    pq = None
+
+SNAPSHOT_DIR = ".snapshots"
+
+#bump this whenever a stage's logic changes so old snapshots stop matching
+FORMAT_VERSION = 6
+
+
+def available():
+    return pq is not None
+
+
+def version_id(key):
+    #a short, filesystem-safe name for a pipeline key
+    digest = hashlib.blake2b(repr((FORMAT_VERSION, key)).encode(), digest_size=12)
+    return digest.hexdigest()
+
+
+class Snapshot:
+    #a snapshot on disk; columns are only read when they're asked for
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    @property
+    def file(self):
+        with self._lock:
+            if self._file is None:
+                self._file = pq.ParquetFile(self.path)
+            return self._file
+
+    @property
+    def columns(self):
+        #data columns only, the saved index isn't one of them
+        #(a RangeIndex is stored as a dict of metadata rather than a column)
+        index_columns = {c for c in self.file.schema_arrow.pandas_metadata.get("index_columns", []) if isinstance(c, str)}
+        return [name for name in self.file.schema_arrow.names if name not in index_columns]
+
+    @property
+    def num_rows(self):
+        return self.file.metadata.num_rows
+
+    def read(self, columns=None):
+        #read the whole snapshot, or only the listed columns
+        return pq.read_table(self.path, columns=columns).to_pandas()
+
+    def column(self, name):
+        return self.read([name])[name]
+
+
+class SnapshotStore:
+
+    def __init__(self, root=SNAPSHOT_DIR, keep=2):
+        self.root = root
+        #how many versions of each stage to keep around on disk
+        self.keep = keep
+
+    def path(self, name, key, extension=".parquet"):
+        return os.path.join(self.root, name, version_id(key) + extension)
+
+    def open(self, name, key):
+        #the snapshot for this version of a stage, or None if it hasn't been written
+        if not available():
+            return None
+        path = self.path(name, key)
+        return Snapshot(path) if os.path.exists(path) else None
+
+    def load(self, name, key):
+        snapshot = self.open(name, key)
+        if snapshot is not None:
+            return snapshot.read()
+        path = self.path(name, key, ".pkl")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        return None
+
+    def save(self, name, key, output):
+        is_frame = isinstance(output, pd.DataFrame)
+        if is_frame and not available():
+            return None
+        path = self.path(name, key, ".parquet" if is_frame else ".pkl")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        #write next to the final file and rename, so readers never see half a snapshot
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        if is_frame:
+            output.to_parquet(tmp_path, engine="pyarrow")
+        else:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._prune(name)
+        return Snapshot(path) if is_frame else None
+
+    def _prune(self, name):
+        directory = os.path.join(self.root, name)
+        snapshots = [os.path.join(directory, f) for f in os.listdir(directory) if f.endswith((".parquet", ".pkl"))]
+        snapshots.sort(key=os.path.getmtime, reverse=True)
+        for old in snapshots[self.keep:]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
@@ -0,0 +1,197 @@
+#synthetic survey and song datasets of any size, with the exact schemas of
+#mxmh_survey_results.csv and songs_normalize.csv, for load testing
+#rows are drawn from the real datasets' own distributions (answer mixes, missing values,
+#multi-genre strings, explicit flags) with per-row noise, so the data looks like the real thing
+#but every row is new. Output is seeded and streamed to disk in chunks.
+#
+#   python synthetic.py survey big_survey.csv 10000000 --seed 1
+#   python synthetic.py songs big_songs.csv 10000000 --seed 1
+import argparse
+import datetime
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+from data_loader import FREQUENCY_COLUMNS, FREQUENCY_LEVELS, MH_COLUMNS
+
+CHUNK_SIZE = 500_000
+
+SURVEY_START = datetime.datetime(2022, 8, 27, 19, 29, 2)
+
+#how often a Frequency answer is redrawn from that column's overall mix instead of kept
+#from the real respondent it was copied from, and how far MH scores wander from theirs
+FREQUENCY_NOISE = 0.25
+SCORE_NOISE = 1
+
+#audio features, redrawn around a real song's values and kept inside the real range
+SONG_FEATURES = ["danceability", "energy", "loudness", "speechiness", "acousticness", "instrumentalness",
+                 "liveness", "valence", "tempo"]
+SONG_FEATURE_NOISE = 0.05
+
+
+class Profile:
+    #everything the generator needs from the real datasets, read once
+
+    def __init__(self, survey_path=data_loader.SURVEY_PATH, songs_path=data_loader.SONGS_PATH):
+        #the raw text, so generated answers are spelled exactly like the real ones
+        survey = pd.read_csv(survey_path, dtype=str, keep_default_na=False, na_values=[""])
+        songs = pd.read_csv(songs_path, dtype=data_loader.SONGS_DTYPES)
+        self.survey_columns = list(survey.columns)
+        self.songs_columns = list(songs.columns)
+
+        #each column's answers and how often they were given, as categorical codes
+        #(-1 is a missing answer, which is drawn as often as it was missing in the real data)
+        self.answers = {}
+        for column in survey.columns.drop(["Timestamp"] + FREQUENCY_COLUMNS + MH_COLUMNS):
+            counts = survey[column].value_counts(dropna=False, normalize=True)
+            codes, categories = pd.factorize(counts.index)
+            self.answers[column] = (codes, categories.to_numpy(dtype=object), counts.to_numpy())
+
+        #Frequency answers as level codes (0-3), copied a whole respondent at a time so
+        #the genre mixes (and their link to the MH scores) stay realistic
+        self.frequencies = np.stack([
+            pd.Categorical(survey[column], categories=FREQUENCY_LEVELS).codes for column in FREQUENCY_COLUMNS],
+            axis=1).astype(np.int8)
+        self.frequency_mix = np.stack([
+            np.bincount(self.frequencies[:, i][self.frequencies[:, i] >= 0], minlength=len(FREQUENCY_LEVELS))
+            / max((self.frequencies[:, i] >= 0).sum(), 1) for i in range(len(FREQUENCY_COLUMNS))])
+        self.scores = survey[MH_COLUMNS].astype("float64").to_numpy()
+
+        self.songs = songs
+        self.feature_range = songs[SONG_FEATURES].agg(["min", "max"])
+        genres = songs["genre"].value_counts(normalize=True)
+        self.genres = (genres.index.to_numpy(dtype=object), genres.to_numpy())
+
+
+_profile = None
+
+
+def default_profile():
+    global _profile
+    if _profile is None:
+        _profile = Profile()
+    return _profile
+
+
+def _choice(rng, values, p, n):
+    #np.random.choice, but by indexing with a cumulative table, which is much faster for big n
+    return values[np.searchsorted(np.cumsum(p), rng.random(n) * p.sum(), side="right").clip(0, len(p) - 1)]
+
+
+def _format_number(values):
+    #whole numbers without a trailing .0, like the real file writes them
+    return [str(int(value)) if value == int(value) else str(value) for value in values]
+
+
+#"19:29:02" for every second of the day, so timestamps are put together by lookup
+_CLOCK = np.array([f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in range(86400)], dtype=object)
+
+
+def _timestamps(rng, start, n):
+    #one response every 30-300 seconds from the start of the survey, in the survey's
+    #month/day/year hour:minute:second format (no leading zeros on the date)
+    seconds = (start + np.arange(n)) * 165 + rng.integers(-135, 136, n) + int(SURVEY_START.timestamp())
+    days, day_index = np.unique(seconds // 86400, return_inverse=True)
+    dates = np.array([f"{d.month}/{d.day}/{d.year} " for d in pd.to_datetime(days * 86400, unit="s")], dtype=object)
+    return dates[day_index] + _CLOCK[seconds % 86400]
+
+
+def survey_chunk(rng, start, n, profile=None):
+    #n survey rows, numbered from `start`
+    profile = profile or default_profile()
+    source = rng.integers(0, len(profile.frequencies), n)
+
+    chunk = {"Timestamp": _timestamps(rng, start, n)}
+
+    #every text column is built as a categorical, which skips creating millions of strings
+    for column, (codes, categories, p) in profile.answers.items():
+        chunk[column] = pd.Categorical.from_codes(_choice(rng, codes, p, n), categories)
+
+    #copy a real respondent's Frequency answers, redrawing some of them from the column's mix
+    levels = profile.frequencies[source]
+    redraw = (rng.random(levels.shape) < FREQUENCY_NOISE) | (levels < 0)
+    for i, column in enumerate(FREQUENCY_COLUMNS):
+        column_levels = levels[:, i].copy()
+        rows = redraw[:, i]
+        column_levels[rows] = _choice(rng, np.arange(len(FREQUENCY_LEVELS)), profile.frequency_mix[i], rows.sum())
+        chunk[column] = pd.Categorical.from_codes(column_levels, FREQUENCY_LEVELS)
+
+    #and their mental health scores, nudged by up to SCORE_NOISE and kept on the 0-10 scale
+    scores = profile.scores[source] + rng.integers(-SCORE_NOISE, SCORE_NOISE + 1, (n, len(MH_COLUMNS)))
+    scores = np.clip(scores, 0, 10)
+    for i, column in enumerate(MH_COLUMNS):
+        values, codes = np.unique(scores[:, i], return_inverse=True)
+        chunk[column] = pd.Categorical.from_codes(codes, _format_number(values))
+
+    return pd.DataFrame(chunk, index=pd.RangeIndex(start, start + n))[profile.survey_columns]
+
+
+def songs_chunk(rng, start, n, profile=None):
+    #n song rows, numbered from `start`; every song is new, artists have several songs each
+    profile = profile or default_profile()
+    real = profile.songs.take(rng.integers(0, len(profile.songs), n)).reset_index(drop=True)
+
+    ids = start + np.arange(n)
+    chunk = real.copy()
+    chunk["artist"] = "Artist " + pd.Series(rng.integers(0, max((start + n) // 8, 1), n)).astype(str)
+    chunk["song"] = "Song " + pd.Series(ids).astype(str)
+    chunk["explicit"] = rng.random(n) < profile.songs["explicit"].mean()
+
+    for column in SONG_FEATURES:
+        low, high = profile.feature_range[column]
+        values = real[column].to_numpy() + rng.normal(0, SONG_FEATURE_NOISE * (high - low), n)
+        chunk[column] = np.clip(values, low, high).round(4 if column != "tempo" else 3)
+    chunk["popularity"] = np.clip(real["popularity"] + rng.integers(-5, 6, n), 0, 100)
+    chunk["genre"] = pd.Categorical.from_codes(_choice(rng, np.arange(len(profile.genres[0])), profile.genres[1], n),
+                                               profile.genres[0])
+
+    chunk.index = pd.RangeIndex(start, start + n)
+    return chunk[profile.songs_columns]
+
+
+def chunks(make_chunk, rows, seed=0, chunk_size=CHUNK_SIZE, profile=None):
+    #the dataset as a stream of frames, each chunk with its own seed derived from `seed`,
+    #so the same seed and chunk size always give the same rows
+    for i, start in enumerate(range(0, rows, chunk_size)):
+        rng = np.random.default_rng([seed, i])
+        yield make_chunk(rng, start, min(chunk_size, rows - start), profile)
+
+
+def survey_chunks(rows, seed=0, chunk_size=CHUNK_SIZE, profile=None):
+    return chunks(survey_chunk, rows, seed, chunk_size, profile)
+
+
+def songs_chunks(rows, seed=0, chunk_size=CHUNK_SIZE, profile=None):
+    return chunks(songs_chunk, rows, seed, chunk_size, profile)
+
+
+def write_csv(path, frames):
+    #stream the chunks to one CSV, never holding more than one chunk in memory
+    rows = 0
+    with open(path, "w", newline="") as f:
+        for i, frame in enumerate(frames):
+            frame.to_csv(f, header=i == 0, index=False)
+            rows += len(frame)
+    return rows
+
+
+def write_survey(path, rows, seed=0, chunk_size=CHUNK_SIZE):
+    return write_csv(path, survey_chunks(rows, seed, chunk_size))
+
+
+def write_songs(path, rows, seed=0, chunk_size=CHUNK_SIZE):
+    return write_csv(path, songs_chunks(rows, seed, chunk_size))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic survey or songs CSV.")
+    parser.add_argument("dataset", choices=["survey", "songs"])
+    parser.add_argument("path")
+    parser.add_argument("rows", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    write = write_survey if args.dataset == "survey" else write_songs
+    write(args.path, args.rows, args.seed, args.chunk_size)
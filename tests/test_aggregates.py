@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import aggregates
+import data_loader
+from pipeline import CleaningPipeline
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    return CleaningPipeline()
+
+
+def chunks(frame, size=97):
+    #uneven chunks, with an empty batch up front and one in the middle
+    pieces = [frame.iloc[start:start + size] for start in range(0, len(frame), size)]
+    return [frame.iloc[:0]] + pieces[:2] + [frame.iloc[:0]] + pieces[2:]
+
+
+def assert_cube_equal(cube, expected):
+    np.testing.assert_array_equal(cube["count"].to_numpy(), expected["count"].to_numpy())
+    pd.testing.assert_frame_equal(cube, expected, check_exact=False, rtol=1e-12, atol=1e-9)
+
+
+@pytest.mark.parametrize("source", ["raw", "loader", "recoded"])
+def test_appended_store_matches_the_batch_cube(pipeline, source):
+    if source == "raw":
+        #plain read_csv: Frequency answers and numbers as text/objects
+        survey = pd.read_csv(data_loader.SURVEY_PATH, dtype=str)
+    elif source == "loader":
+        survey = data_loader.load_survey()
+    else:
+        survey = pipeline.get("frequencies_recoded")
+
+    store = aggregates.AggregateStore()
+    for batch in chunks(survey):
+        store.append(batch)
+
+    assert_cube_equal(store.cube(), pipeline.get("frequency_cube"))
+    pd.testing.assert_frame_equal(store.mh_by_genre(), pipeline.get("mh_by_genre"), check_exact=False)
+    pd.testing.assert_frame_equal(store.effect_table(), pipeline.get("effect_df"), check_exact=False)
+    assert store.rows == len(pipeline.get("outliers_removed"))
+
+
+@pytest.mark.parametrize("chunk_size", [7, 50, 10_000])
+def test_streamed_cube_matches_the_batch_cube(pipeline, chunk_size):
+    cube = aggregates.stream_frequency_cube(data_loader.SURVEY_PATH, chunk_size)
+    assert_cube_equal(cube, pipeline.get("frequency_cube"))
+
+
+def test_empty_store_has_an_empty_cube():
+    store = aggregates.AggregateStore()
+    assert store.append(data_loader.load_survey().iloc[:0]) == []
+    cube = store.cube()
+    assert (cube["count"] == 0).all() and cube["mean"].isna().all()
+
+
+def test_box_cube_matches_matplotlib_boxplot_stats(pipeline):
+    from matplotlib.cbook import boxplot_stats
+
+    survey = pipeline.get("cleaned_data")
+    cube = aggregates.box_cube(survey)
+    cells = 0
+    for (genre, level, measure), row in cube.iterrows():
+        answered = survey[f"Frequency [{genre}]"] == level
+        values = survey.loc[answered.fillna(False).to_numpy(), measure].dropna().to_numpy()
+        assert row["count"] == len(values)
+        if not len(values):
+            assert np.isnan(row.med)
+            continue
+        expected = boxplot_stats(values, whis=1.5)[0]
+        for stat in ("med", "q1", "q3", "whislo", "whishi"):
+            assert row[stat] == pytest.approx(expected[stat]), (genre, level, measure, stat)
+        np.testing.assert_array_equal(row.fliers, np.sort(expected["fliers"]))
+        cells += 1
+    assert cells > 0
+
+
+def test_box_stats_labels_the_answered_levels(pipeline):
+    cube = pipeline.get("cleaned_box_cube")
+    boxes = aggregates.box_stats(cube, "Rock", "Anxiety")
+    answered = pipeline.get("cleaned_data")["Frequency [Rock]"].dropna().unique()
+    assert [box["label"] for box in boxes] == [data_loader.FREQUENCY_LEVELS[level - 1] for level in sorted(answered)]
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from imblearn.under_sampling import RandomUnderSampler
+
+import cleaning
+from pipeline import CleaningPipeline
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    return CleaningPipeline()
+
+
+def sampler_indices(targets, random_state=42):
+    sampler = RandomUnderSampler(random_state=random_state)
+    sampler.fit_resample(np.zeros((len(targets), 1)), targets)
+    return sampler.sample_indices_
+
+
+@pytest.mark.parametrize("stage, column", [
+    ("genres_downsampled", "Anxiety"),
+    ("anxiety_balanced", "Depression"),
+])
+def test_balanced_indices_match_random_under_sampler(pipeline, stage, column):
+    survey = pipeline.get(stage, copy=False)
+    targets = cleaning.binary_categories(survey, [column])[:, 0]
+    for random_state in (0, 42, 1234):
+        np.testing.assert_array_equal(cleaning.balanced_indices(targets, random_state),
+                                      sampler_indices(targets, random_state))
+
+
+def test_joint_balancing_matches_random_under_sampler_over_combined_classes(pipeline):
+    survey = pipeline.get("genres_downsampled", copy=False)
+    targets = cleaning.binary_categories(survey, ["Anxiety", "Depression"])
+    #the (Anxiety, Depression) pairs as one label, numbered in the same order np.unique sorts the rows
+    combined = targets[:, 0] * 2 + targets[:, 1]
+    np.testing.assert_array_equal(cleaning.balanced_indices(targets), sampler_indices(combined))
+
+
+def test_balancing_stages_take_the_sampled_rows(pipeline):
+    survey = pipeline.get("genres_downsampled", copy=False)
+    expected = survey.iloc[sampler_indices(cleaning.binary_categories(survey, ["Anxiety"])[:, 0])]
+    balanced = pipeline.get("anxiety_balanced", copy=False)
+    assert balanced.reset_index(drop=True).equals(expected.reset_index(drop=True))
+
+
+def test_missing_frequency_answers_stay_missing_when_encoded():
+    import aggregates
+    import correlation
+    from data_loader import FREQUENCY_COLUMNS, FREQUENCY_LEVELS, MH_COLUMNS, load_survey
+
+    survey = cleaning.remove_outliers(load_survey())
+    rng = np.random.default_rng(0)
+    blanked = {column: rng.random(len(survey)) < 0.2 for column in FREQUENCY_COLUMNS[:4]}
+    for column, rows in blanked.items():
+        survey.loc[rows, column] = np.nan
+
+    encoded = cleaning.encode_survey(survey)
+    for column in FREQUENCY_COLUMNS:
+        levels = encoded[column]
+        assert str(levels.dtype) == "UInt8"
+        np.testing.assert_array_equal(levels.isna().to_numpy(), survey[column].isna().to_numpy())
+        answered = levels.notna().to_numpy()
+        expected = survey[column].cat.codes.to_numpy()[answered] + 1
+        np.testing.assert_array_equal(levels.to_numpy()[answered], expected)
+        assert set(levels.dropna()) <= set(range(1, len(FREQUENCY_LEVELS) + 1))
+    #the raw block marks them with 0, which isn't a level
+    np.testing.assert_array_equal(cleaning.frequency_matrix(encoded), cleaning.frequency_matrix(survey))
+
+    cube = aggregates.frequency_cube(encoded)
+    correlations = correlation.correlations(encoded)
+    for column, rows in blanked.items():
+        genre = column[len("Frequency ["):-1]
+        for measure in MH_COLUMNS:
+            scored = survey[measure].notna().to_numpy()
+            assert cube.loc[(genre, slice(None), measure), "count"].sum() == (scored & ~rows).sum()
+            assert correlations.counts().loc[column, measure] == (scored & ~rows).sum()
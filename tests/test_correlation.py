@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from correlation import CorrelationStore
+from data_loader import FREQUENCY_COLUMNS, MH_COLUMNS
+
+COLUMNS = FREQUENCY_COLUMNS[:4] + MH_COLUMNS
+
+
+def survey(rows=480, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({column: rng.integers(1, 5, rows) for column in FREQUENCY_COLUMNS[:4]})
+    for column in MH_COLUMNS:
+        frame[column] = rng.integers(0, 11, rows).astype("float64")
+    return frame
+
+
+def with_missing(frame, fraction=0.2, seed=1):
+    #a fifth of each Frequency column left unanswered
+    rng = np.random.default_rng(seed)
+    frame = frame.astype("float64")
+    for column in FREQUENCY_COLUMNS[:4]:
+        frame.loc[rng.random(len(frame)) < fraction, column] = np.nan
+    return frame
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman", "kendall"])
+@pytest.mark.parametrize("encoding", ["nan", "nullable", "zero"])
+def test_missing_frequency_answers_are_pairwise_complete(method, encoding):
+    frame = with_missing(survey())
+    batch = frame.copy()
+    if encoding == "nullable":
+        batch[FREQUENCY_COLUMNS[:4]] = batch[FREQUENCY_COLUMNS[:4]].astype("UInt8")
+    elif encoding == "zero":
+        #the missing-answer 0 from cleaning.frequency_matrix
+        batch[FREQUENCY_COLUMNS[:4]] = batch[FREQUENCY_COLUMNS[:4]].fillna(0).astype("uint8")
+
+    store = CorrelationStore(COLUMNS)
+    for start in range(0, len(batch), 100):
+        store.append(batch.iloc[start:start + 100])
+
+    expected = frame.corr(method=method)
+    pd.testing.assert_frame_equal(store.matrix(method), expected, check_exact=False, atol=1e-9)
+    counts = frame.notna().astype(int)
+    pd.testing.assert_frame_equal(store.counts(), (counts.T @ counts).astype("float64"))
@@ -0,0 +1,39 @@
+import pandas as pd
+import pytest
+
+figures = pytest.importorskip("figures")
+
+
+def test_unbound_closure_cells_are_fingerprinted():
+    def section(scale):
+        def draw():
+            return later * scale
+        key = figures.figure_key(draw)
+        later = 2
+        return key, figures.figure_key(draw)
+
+    unbound, bound = section(1)
+    assert unbound == section(1)[0]
+    assert unbound != bound
+    assert section(3)[0] != unbound
+
+
+def test_self_referencing_functions_are_fingerprinted():
+    def section(depth):
+        def walk(n):
+            return walk(n - 1) if n else depth
+        return figures.figure_key(walk)
+
+    assert section(1) == section(1)
+    assert section(1) != section(2)
+
+
+def test_closed_over_frames_are_keyed_on_their_contents():
+    frame = pd.DataFrame({"Anxiety": [1.0, 2.0]})
+
+    def draw():
+        return frame
+
+    key = figures.figure_key(draw)
+    frame.loc[0, "Anxiety"] = 5.0
+    assert figures.figure_key(draw) != key
@@ -0,0 +1,54 @@
+import asyncio
+
+import service
+
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-length", b"2")]})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def exchange(*requests, hang_up=True):
+    #send each request on its own connection and hang up (or just stop sending); returns what
+    #came back and anything the connection tasks raised
+    errors = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+    tasks = []
+
+    async def handle(reader, writer):
+        tasks.append(asyncio.current_task())
+        await service._handle_connection(ok_app, reader, writer)
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    replies = []
+    async with server:
+        for request in requests:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            await writer.drain()
+            if hang_up:
+                writer.close()
+            else:
+                writer.write_eof()
+            replies.append(await reader.read())
+            writer.close()
+        await asyncio.sleep(0.05)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    return replies, [result for result in results if isinstance(result, BaseException)] + errors
+
+
+def test_client_closing_before_the_announced_body_is_sent():
+    replies, errors = asyncio.run(exchange(
+        b"GET /health HTTP/1.1\r\ncontent-length: 100\r\n\r\nabc",
+        b"GET /health HTTP/1.1\r\ncontent-length: 5\r\n\r\n",
+    ))
+    assert errors == []
+    assert replies == [b"", b""]
+
+
+def test_complete_requests_still_get_answered():
+    request = b"GET /health HTTP/1.1\r\nconnection: close\r\ncontent-length: 3\r\n\r\nabc"
+    replies, errors = asyncio.run(exchange(request, hang_up=False))
+    assert errors == []
+    assert replies[0].startswith(b"HTTP/1.1 200 OK\r\n") and replies[0].endswith(b"{}")
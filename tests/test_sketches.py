@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import sketches
+
+QUANTILES = np.linspace(0, 1, 101)
+
+
+def rank_error(sketch, data):
+    #worst distance, as a share of the values, between the rank asked for and the rank answered
+    ordered = np.sort(data)
+    ranks = np.searchsorted(ordered, sketch.quantile(QUANTILES), side="right")
+    return np.abs(ranks - QUANTILES * len(data)).max() / len(data)
+
+
+def weight(sketch):
+    return sum(len(items) * 2 ** h for h, items in enumerate(sketch.levels))
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 150, sketches.DEFAULT_K])
+def test_small_sketches_are_exact(n):
+    data = np.random.default_rng(n).normal(size=n)
+    sketch = sketches.KLLSketch().update(data)
+    np.testing.assert_allclose(sketch.quantile(QUANTILES), pd.Series(data).quantile(QUANTILES).to_numpy())
+    assert sketch.median() == pytest.approx(np.median(data))
+    np.testing.assert_array_equal(sketch.rank(data), pd.Series(data).rank(method="max").to_numpy())
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_rank_error_stays_within_the_bound(seed):
+    data = np.random.default_rng(seed).lognormal(size=200_000)
+    sketch = sketches.KLLSketch(seed=seed).update(data)
+    assert sum(len(items) for items in sketch.levels) <= 3 * sketches.DEFAULT_K
+    assert weight(sketch) == len(sketch) == len(data)
+    assert rank_error(sketch, data) <= 0.01
+
+
+def test_merged_small_sketches_equal_one_sketch_over_the_concatenated_data():
+    data = np.random.default_rng(0).integers(60, 200, sketches.DEFAULT_K).astype("float64")
+    parts = [sketches.KLLSketch(seed=i).update(chunk) for i, chunk in enumerate(np.array_split(data, 5))]
+    merged = sketches.merge_all(parts)
+    single = sketches.KLLSketch().update(data)
+    assert len(merged) == len(single) == len(data)
+    np.testing.assert_array_equal(merged.quantile(QUANTILES), single.quantile(QUANTILES))
+    np.testing.assert_array_equal(merged.histogram([60, 100, 150, 200]), single.histogram([60, 100, 150, 200]))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_merged_sketches_keep_the_rank_error_bound(seed):
+    data = np.random.default_rng(seed).normal(size=200_000)
+    parts = [sketches.KLLSketch(seed=i).update(chunk) for i, chunk in enumerate(np.array_split(data, 13))]
+    merged = sketches.merge_all(parts)
+    assert weight(merged) == len(merged) == len(data)
+    assert rank_error(merged, data) <= 0.01
+
+
+def test_grouped_sketch_matches_groupby_median_on_the_survey():
+    import data_loader
+
+    survey = data_loader.load_survey()
+    chunks = [survey.iloc[start:start + 100] for start in range(0, len(survey), 100)]
+    merged = sketches.merge_all(sketches.bpm_sketch([chunk]) for chunk in chunks)
+    expected = survey.groupby("Fav genre", observed=True)["BPM"].median().dropna()
+    medians = merged.median()
+    assert list(medians.index) == list(expected.index)
+    np.testing.assert_array_equal(medians.to_numpy(), expected.to_numpy())
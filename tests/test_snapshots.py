@@ -0,0 +1,70 @@
+import os
+
+import pandas as pd
+import pytest
+
+import pipeline
+import snapshots
+
+pytestmark = pytest.mark.skipif(not snapshots.available(), reason="snapshots need pyarrow")
+
+FRAME_STAGES = ["cleaned_data", "songs_expanded", "frequency_cube"]
+
+
+def unreachable(*args):
+    raise AssertionError("stage was recomputed instead of read from its snapshot")
+
+
+def cold_pipeline(store):
+    #a fresh pipeline whose snapshotted stages can only come from disk
+    cold = pipeline.CleaningPipeline(snapshot_store=store)
+    for name in cold.snapshot_stages:
+        parents, _ = cold.stages[name]
+        cold.stages[name] = (parents, unreachable)
+    return cold
+
+
+@pytest.fixture
+def store(tmp_path):
+    return snapshots.SnapshotStore(str(tmp_path))
+
+
+def test_snapshots_round_trip(store):
+    warm = pipeline.CleaningPipeline(snapshot_store=store)
+    expected = {name: warm.get(name) for name in FRAME_STAGES + ["similarity_index"]}
+    cold = cold_pipeline(store)
+
+    for name in FRAME_STAGES:
+        assert os.path.exists(store.path(name, warm.content_key(warm.key(name))))
+        pd.testing.assert_frame_equal(cold.get(name), expected[name])
+
+    index = cold.get("similarity_index", copy=False)
+    song_id = index.song_id(*expected["songs_expanded"].loc[0, ["artist", "song"]])
+    pd.testing.assert_frame_equal(index.similar(song_id), expected["similarity_index"].similar(song_id))
+
+
+def test_snapshot_reads_single_columns(store):
+    warm = pipeline.CleaningPipeline(snapshot_store=store)
+    cleaned = warm.get("cleaned_data")
+    snapshot = cold_pipeline(store).snapshot("cleaned_data")
+    assert snapshot.columns == list(cleaned.columns)
+    assert snapshot.num_rows == len(cleaned)
+    pd.testing.assert_series_equal(snapshot.column("Frequency [Rock]"), cleaned["Frequency [Rock]"],
+                                   check_index=False)
+
+
+def test_snapshots_from_another_format_version_are_rebuilt(store, monkeypatch):
+    warm = pipeline.CleaningPipeline(snapshot_store=store)
+    expected = warm.get("cleaned_data")
+    key = warm.content_key(warm.key("cleaned_data"))
+
+    #a stale snapshot for the same data, written by an older version of the stages
+    monkeypatch.setattr(snapshots, "FORMAT_VERSION", snapshots.FORMAT_VERSION - 1)
+    store.save("cleaned_data", key, expected.head(3))
+    assert len(pipeline.CleaningPipeline(snapshot_store=store).get("cleaned_data")) == 3
+    monkeypatch.undo()
+
+    os.remove(store.path("cleaned_data", key))
+    rebuilt = pipeline.CleaningPipeline(snapshot_store=store).get("cleaned_data")
+    pd.testing.assert_frame_equal(rebuilt, expected)
+    assert os.path.exists(store.path("cleaned_data", key))
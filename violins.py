@@ -0,0 +1,148 @@
+#violin plots whose shapes are worked out here instead of in the browser
+#px.violin(..., box=True, points='all') sends every row to the page and has plotly.js run a
+#KDE per group there, so the chart grows with the survey. Here each group's density curve
+#(gaussian KDE, same bandwidth rule as plotly) and box statistics are computed with numpy,
+#and only a capped sample of the raw points, stratified by group, goes along with them, so the
+#figure has the same size and draw time at a few hundred rows or a few million
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+#points along each density curve
+GRID = 64
+#histogram bins the values are counted into before smoothing (keeps the KDE O(rows))
+BINS = 512
+#most raw points shown across all groups
+MAX_POINTS = 2000
+#fewest points a (big enough) group gets, however small its share of the rows
+MIN_POINTS = 20
+#plotly's default trace colour and violin half-width
+COLOR = "#636efa"
+HALF_WIDTH = 0.4
+
+
+class ViolinStats:
+
+    def __init__(self, groups, sizes, grid, density, box, points):
+        #group labels in plotting order, and rows per group
+        self.groups = groups
+        self.sizes = sizes
+        #groups x GRID values and (unscaled) densities along each curve
+        self.grid = grid
+        self.density = density
+        #q1, median, q3, lowerfence, upperfence per group
+        self.box = box
+        #the sampled rows: group position and value
+        self.points = points
+
+
+def _group_codes(keys):
+    #categoricals keep their category order (unused categories dropped), anything else goes in
+    #order of first appearance, like plotly express
+    if isinstance(keys.dtype, pd.CategoricalDtype):
+        codes, groups = keys.cat.codes.to_numpy(), keys.cat.categories
+        used = np.flatnonzero(np.bincount(codes, minlength=len(groups)))
+        remap = np.full(len(groups), -1)
+        remap[used] = np.arange(len(used))
+        return remap[codes], list(groups[used])
+    codes, groups = pd.factorize(keys, sort=False)
+    return codes, list(groups)
+
+
+def _box(values, codes):
+    #quartiles (linear interpolation, as plotly's default quartilemethod) and the whisker ends:
+    #the furthest values within 1.5 IQR of the box
+    grouped = pd.Series(values).groupby(codes)
+    quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    q1, median, q3 = (quartiles[q].to_numpy() for q in (0.25, 0.5, 0.75))
+    iqr = q3 - q1
+    inside = (values >= (q1 - 1.5 * iqr)[codes]) & (values <= (q3 + 1.5 * iqr)[codes])
+    fenced = pd.Series(values[inside]).groupby(codes[inside])
+    return pd.DataFrame({
+        "q1": q1, "median": median, "q3": q3,
+        "lowerfence": fenced.min().to_numpy(), "upperfence": fenced.max().to_numpy(),
+    })
+
+
+def _kde(values, codes, sizes, iqr, grid_size, bins):
+    #all groups at once: one 2-d histogram pass over the rows, then each group's gaussian kernel
+    #applied to its bin counts on its own grid (plotly's 'soft' span, 2 bandwidths past the data)
+    n_groups = len(sizes)
+    low, high = values.min(), values.max()
+    width = (high - low) / bins or 1.0
+    bin_index = np.minimum(((values - low) / width).astype(np.int64), bins - 1)
+    counts = np.bincount(codes * bins + bin_index, minlength=n_groups * bins).reshape(n_groups, bins)
+    centers = low + width * (np.arange(bins) + 0.5)
+
+    #silverman's rule, as plotly.js uses
+    grouped = pd.Series(values).groupby(codes)
+    std = grouped.std().fillna(0).to_numpy()
+    spread = np.minimum(std, iqr / 1.349)
+    spread = np.where(spread > 0, spread, np.where(std > 0, std, 1.0))
+    bandwidth = 1.059 * spread * sizes ** -0.2
+
+    start = grouped.min().to_numpy() - 2 * bandwidth
+    stop = grouped.max().to_numpy() + 2 * bandwidth
+    grid = start[:, None] + np.linspace(0, 1, grid_size) * (stop - start)[:, None]
+    kernel = np.exp(-0.5 * ((grid[:, :, None] - centers) / bandwidth[:, None, None]) ** 2)
+    density = np.einsum("gpb,gb->gp", kernel, counts) / (sizes * bandwidth * np.sqrt(2 * np.pi))[:, None]
+    return grid, density
+
+
+def _sample(codes, sizes, max_points, min_points, seed):
+    #each group keeps a share of max_points proportional to its size (but at least min_points,
+    #or all of it if it's smaller); which rows is decided by one random key per row
+    quota = np.maximum(np.round(max_points * sizes / sizes.sum()), min_points)
+    quota = np.minimum(quota, sizes)
+    keys = np.random.default_rng(seed).random(len(codes))
+    rank = pd.Series(keys).groupby(codes).rank(method="first").to_numpy()
+    return np.flatnonzero(rank <= quota[codes])
+
+
+def summarize(frame, x, y, grid=GRID, bins=BINS, max_points=MAX_POINTS, min_points=MIN_POINTS, seed=42):
+    data = frame[[x, y]].dropna()
+    codes, groups = _group_codes(data[x])
+    values = data[y].to_numpy(dtype=float)
+    sizes = np.bincount(codes, minlength=len(groups))
+
+    box = _box(values, codes)
+    curve_grid, density = _kde(values, codes, sizes, (box["q3"] - box["q1"]).to_numpy(), grid, bins)
+    picked = _sample(codes, sizes, max_points, min_points, seed)
+    points = pd.DataFrame({"position": codes[picked], "value": values[picked]})
+    return ViolinStats(groups, sizes, curve_grid, density, box, points)
+
+
+def violin(frame, x, y, labels=None, title=None, seed=42, **options):
+    #stands in for px.violin(frame, x=x, y=y, box=True, points='all', labels=labels, title=title)
+    labels = labels or {}
+    stats = summarize(frame, x, y, seed=seed, **options)
+    fig = go.Figure()
+
+    #every violin scaled to the same width (plotly's scalemode='width'); curves and points are sent
+    #as float32, plenty for a chart and half the payload
+    half = HALF_WIDTH * stats.density / stats.density.max(axis=1, keepdims=True)
+    for position, group in enumerate(stats.groups):
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([position - half[position], position + half[position][::-1]]).astype(np.float32),
+            y=np.concatenate([stats.grid[position], stats.grid[position][::-1]]).astype(np.float32),
+            fill="toself", mode="lines", line=dict(color=COLOR, width=1), opacity=0.6,
+            name=str(group), hoverinfo="skip", showlegend=False))
+
+    fig.add_trace(go.Box(
+        x=np.arange(len(stats.groups)), q1=stats.box["q1"], median=stats.box["median"], q3=stats.box["q3"],
+        lowerfence=stats.box["lowerfence"], upperfence=stats.box["upperfence"],
+        width=0.1, marker_color=COLOR, fillcolor="white", name=str(y), showlegend=False))
+
+    #sampled points, jittered across the middle of their violin
+    jitter = np.random.default_rng(seed).uniform(-HALF_WIDTH / 2, HALF_WIDTH / 2, len(stats.points))
+    fig.add_trace(go.Scatter(
+        x=(stats.points["position"] + jitter).astype(np.float32), y=stats.points["value"].astype(np.float32), mode="markers",
+        marker=dict(color=COLOR, size=3, opacity=0.5), hovertemplate=f"{y}: %{{y}}<extra></extra>",
+        showlegend=False))
+
+    tick_labels = [f"{group}<br>(n={size})" for group, size in zip(stats.groups, stats.sizes)]
+    fig.update_layout(
+        title=title,
+        xaxis=dict(title=labels.get(x, x), tickvals=list(range(len(stats.groups))), ticktext=tick_labels),
+        yaxis=dict(title=labels.get(y, y)))
+    return fig